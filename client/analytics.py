@@ -89,11 +89,8 @@ def analyze_by_type(threads: List[Dict]) -> Dict[str, Any]:
     Returns:
         Dict with type counts and breakdowns
     """
-    # Count types with defensive get
-    type_counts = Counter()
-    for t in threads:
-        if 'type' in t:
-            type_counts[t['type']] += 1
+    # Count types, skipping threads without one
+    type_counts = Counter(t['type'] for t in threads if 'type' in t)
 
     # Breakdown by content for specific types
     status_values = Counter()
@@ -252,11 +249,7 @@ def analyze_folios_by_type(folios: List[Dict]) -> Dict[str, int]:
     Returns:
         Dict mapping folio type to count
     """
-    type_counts = Counter()
-    for folio in folios:
-        if 'type' in folio:
-            type_counts[folio['type']] += 1
-    return dict(type_counts)
+    return dict(Counter(folio['type'] for folio in folios if 'type' in folio))
 
 
 def analyze_folios_by_status(folios: List[Dict]) -> Dict[str, int]:
@@ -268,11 +261,7 @@ def analyze_folios_by_status(folios: List[Dict]) -> Dict[str, int]:
     Returns:
         Dict mapping status to count
     """
-    status_counts = Counter()
-    for folio in folios:
-        status = folio.get('status', 'unknown')
-        status_counts[status] += 1
-    return dict(status_counts)
+    return dict(Counter(folio.get('status', 'unknown') for folio in folios))
 
 
 def analyze_folios_by_site(folios: List[Dict]) -> Dict[str, int]:
@@ -284,11 +273,7 @@ def analyze_folios_by_site(folios: List[Dict]) -> Dict[str, int]:
     Returns:
         Dict mapping site_id to count
     """
-    site_counts = Counter()
-    for folio in folios:
-        site_id = folio.get('site_id', 'unknown')
-        site_counts[site_id] += 1
-    return dict(site_counts)
+    return dict(Counter(folio.get('site_id', 'unknown') for folio in folios))
 
 
 def get_folio_stats(folios: List[Dict]) -> Dict[str, Any]:
@@ -300,11 +285,23 @@ def get_folio_stats(folios: List[Dict]) -> Dict[str, Any]:
     Returns:
         Dict with total, by_type, by_status, by_site
     """
+    # One pass over the folios for all three breakdowns (same rules as the
+    # analyze_folios_by_* helpers)
+    by_type, by_status, by_site = {}, {}, {}
+    for folio in folios:
+        if 'type' in folio:
+            folio_type = folio['type']
+            by_type[folio_type] = by_type.get(folio_type, 0) + 1
+        status = folio.get('status', 'unknown')
+        by_status[status] = by_status.get(status, 0) + 1
+        site_id = folio.get('site_id', 'unknown')
+        by_site[site_id] = by_site.get(site_id, 0) + 1
+
     return {
         'total': len(folios),
-        'by_type': analyze_folios_by_type(folios),
-        'by_status': analyze_folios_by_status(folios),
-        'by_site': analyze_folios_by_site(folios)
+        'by_type': by_type,
+        'by_status': by_status,
+        'by_site': by_site
     }
 
 
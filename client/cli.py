@@ -83,7 +83,9 @@ def get_agent_id(ctx_agent: Optional[str] = None, base_url: Optional[str] = None
     """
     if ctx_agent:
         return ctx_agent
-    return os.getenv("SKEIN_AGENT_ID")
+    # Read on every call: the environment can change within one process
+    # (click's CliRunner, patched test environments)
+    return os.environ.get("SKEIN_AGENT_ID") or None
 
 
 def get_base_url(ctx_url: Optional[str] = None) -> str:
@@ -5014,8 +5016,10 @@ def shard_graft(ctx, worktree_name):
 @click.argument("worktree_name")
 @click.option("--caller-cwd", "explicit_caller_cwd", default=None,
               help="Original working directory of caller (for orchestration tools)")
+@click.option("--ff", "fast_forward", is_flag=True,
+              help="Fast-forward master instead of creating a merge commit when possible")
 @click.pass_context
-def shard_merge(ctx, worktree_name, explicit_caller_cwd):
+def shard_merge(ctx, worktree_name, explicit_caller_cwd, fast_forward):
     """
     Merge SHARD branch into master and cleanup.
 
@@ -5024,8 +5028,12 @@ def shard_merge(ctx, worktree_name, explicit_caller_cwd):
 
     If conflicts are detected, suggests using 'skein shard graft' instead.
 
+    Use --ff to skip the merge commit when master hasn't moved since the
+    shard branched.
+
     Example:
         skein shard merge beadle_0001-20251202-001
+        skein shard merge beadle_0001-20251202-001 --ff
 
     For orchestration tools (e.g., Spindle), pass --caller-cwd to prevent
     agents from merging their own worktree after cd-ing elsewhere.
@@ -5058,7 +5066,9 @@ def shard_merge(ctx, worktree_name, explicit_caller_cwd):
 
         click.echo("Testing integration with current master...")
 
-        result = shard_worktree.merge_shard(worktree_name, caller_cwd=caller_cwd)
+        result = shard_worktree.merge_shard(
+            worktree_name, caller_cwd=caller_cwd, fast_forward=fast_forward
+        )
 
         if result["success"]:
             # Show drift context in success message
@@ -6282,7 +6292,8 @@ def shard_test(ctx, worktree_name, rite_name, verbose):
 @click.option("--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
 @click.option("--port", "-p", default=8003, type=int, help="Port to listen on (default: 8003)")
 @click.option("--open", "open_browser", is_flag=True, help="Open browser after starting")
-def web(host, port, open_browser):
+@click.option("--workers", default=1, type=int, help="Number of server processes (default: 1)")
+def web(host, port, open_browser, workers):
     """Launch the SKEIN web UI.
 
     Opens a browser-based interface for viewing sites, folios, and activity.
@@ -6291,6 +6302,7 @@ def web(host, port, open_browser):
         skein web              # Start on localhost:8003
         skein web --port 8080  # Start on custom port
         skein web --open       # Start and open browser
+        skein web --workers 4  # Serve from four processes
     """
     try:
         from skein.web import run_server
@@ -6319,7 +6331,7 @@ def web(host, port, open_browser):
         import webbrowser
         webbrowser.open(f"http://{host}:{port}")
 
-    run_server(host=host, port=port)
+    run_server(host=host, port=port, workers=workers)
 
 
 # Alias: 'skein ui' as shortcut for 'skein web'
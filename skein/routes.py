@@ -2,10 +2,13 @@
 SKEIN FastAPI routes.
 """
 
-import logging
 import base64
+import fnmatch
+import json
+import logging
 import re
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, Query, Header, Depends
@@ -26,7 +29,9 @@ from .storage import JSONStore, LogDatabase, get_data_dir_for_project
 from .utils import (
     generate_folio_id, generate_thread_id, generate_yield_id, parse_mentions,
     get_current_status, get_current_assignment,
+    get_current_statuses, get_status_map,
     auto_invalidate_cache,
+    format_relative_time,
     parse_relative_time,
     generate_agent_name
 )
@@ -160,21 +165,20 @@ async def get_roster_enriched(
     - Working site they're posting to
     - Folio count and last folio type
     """
-    from .utils import format_relative_time
-    from datetime import timedelta, timezone
-
     agents = store.get_agents(status=status)
     all_folios = store.get_folios()
 
+    # Group folios by author once instead of filtering per agent
+    folios_by_author: Dict[str, List[Folio]] = {}
+    for f in all_folios:
+        folios_by_author.setdefault(f.created_by, []).append(f)
+
     enriched = []
     now = datetime.now(timezone.utc)
 
     for agent in agents:
         # Get all folios created by this agent
-        agent_folios = [f for f in all_folios if f.created_by == agent.agent_id]
-
-        # Sort by created_at descending to get most recent
-        agent_folios.sort(key=lambda f: f.created_at, reverse=True)
+        agent_folios = folios_by_author.get(agent.agent_id, [])
 
         # Determine activity info
         last_activity = None
@@ -184,7 +188,8 @@ async def get_roster_enriched(
         folio_count = len(agent_folios)
 
         if agent_folios:
-            most_recent = agent_folios[0]
+            # Only the most recent matters; no need to sort them all
+            most_recent = max(agent_folios, key=lambda f: f.created_at)
             last_activity = most_recent.created_at
             last_activity_relative = format_relative_time(most_recent.created_at)
             working_site = most_recent.site_id
@@ -373,10 +378,9 @@ async def get_site_folios(
     folios = store.get_folios(site_id=site_id)
 
     # PURE THREADS: Compute status and assigned_to from threads
+    status_map = get_status_map([f.folio_id for f in folios], store)
     for folio in folios:
-        computed_status = get_current_status(folio.folio_id, store)
-        computed_assignment = get_current_assignment(folio.folio_id, store)
-
+        computed_status, computed_assignment = status_map[folio.folio_id]
         # Use computed values, fall back to stored values during migration
         folio.status = computed_status or folio.status or "open"
         folio.assigned_to = computed_assignment or folio.assigned_to
@@ -634,10 +638,9 @@ async def get_folios(
     folios = store.get_folios(site_id=site_id)
 
     # PURE THREADS: Compute status and assigned_to from threads
+    status_map = get_status_map([f.folio_id for f in folios], store)
     for folio in folios:
-        computed_status = get_current_status(folio.folio_id, store)
-        computed_assignment = get_current_assignment(folio.folio_id, store)
-
+        computed_status, computed_assignment = status_map[folio.folio_id]
         # Use computed values, fall back to stored values during migration
         folio.status = computed_status or folio.status or "open"
         folio.assigned_to = computed_assignment or folio.assigned_to
@@ -679,9 +682,10 @@ async def search_folios(
 
     if status:
         # Get status from threads with fallback to stored field (consistent with /folios endpoint)
+        statuses = get_current_statuses([f.folio_id for f in matching], store)
         matching = [
             f for f in matching
-            if (get_current_status(f.folio_id, store) or f.status or "open") == status
+            if (statuses[f.folio_id] or f.status or "open") == status
         ]
 
     return matching
@@ -897,8 +901,7 @@ async def get_threads(
                 thread_dt = t.created_at
                 # If thread is naive and since_dt is aware, make thread aware (assume UTC)
                 if thread_dt.tzinfo is None and since_dt.tzinfo is not None:
-                    from datetime import timezone as tz
-                    thread_dt = thread_dt.replace(tzinfo=tz.utc)
+                    thread_dt = thread_dt.replace(tzinfo=timezone.utc)
                 filtered_threads.append((t, thread_dt >= since_dt))
             threads = [t for t, keep in filtered_threads if keep]
         except ValueError as e:
@@ -959,6 +962,15 @@ async def get_log_streams(log_db: LogDatabase = Depends(get_project_log_db)):
     return {"streams": log_db.get_streams()}
 
 
+def _parse_meta_value(value: str) -> Any:
+    """Coerce a key=value filter value to the JSON scalar it spells, if any."""
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value
+    return parsed if isinstance(parsed, (str, int, float, bool)) else value
+
+
 @router.get("/logs/{stream_id}", response_model=List[LogLine])
 async def get_logs(
     stream_id: str,
@@ -966,10 +978,25 @@ async def get_logs(
     level: Optional[str] = None,
     search: Optional[str] = None,
     limit: int = Query(1000, le=10000),
+    meta: Optional[List[str]] = Query(None, description="Metadata filters as key=value"),
     log_db: LogDatabase = Depends(get_project_log_db)
 ):
-    """Get logs from a stream with filters."""
-    return log_db.get_logs(stream_id, since, level, search, limit)
+    """
+    Get logs from a stream with filters.
+
+    meta values are read as JSON scalars when they parse as one (step=1,
+    done=true); anything else, or a quoted string (run="123"), matches as text.
+    """
+    meta_filter = {}
+    for item in meta or []:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise HTTPException(status_code=400, detail=f"Invalid metadata filter: '{item}' (use key=value)")
+        meta_filter[key] = _parse_meta_value(value)
+    try:
+        return log_db.get_logs(stream_id, since, level, search, limit, meta_filter=meta_filter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 # Discovery Endpoints
@@ -1051,7 +1078,6 @@ async def unified_search(
         limit: Results per resource type (max 500)
         offset: Skip first N results
     """
-    import time
     start_time = time.time()
 
     # Parse resources
@@ -1090,9 +1116,9 @@ async def unified_search(
         folios = store.get_folios()
 
         # Compute status from threads
+        status_map = get_status_map([f.folio_id for f in folios], store)
         for folio in folios:
-            computed_status = get_current_status(folio.folio_id, store)
-            computed_assignment = get_current_assignment(folio.folio_id, store)
+            computed_status, computed_assignment = status_map[folio.folio_id]
             folio.status = computed_status or folio.status or "open"
             folio.assigned_to = computed_assignment or folio.assigned_to
 
@@ -1113,7 +1139,6 @@ async def unified_search(
 
         if sites:
             # Support glob patterns
-            import fnmatch
             folios = [
                 f for f in folios
                 if any(fnmatch.fnmatch(f.site_id, pattern) for pattern in sites)
@@ -1192,8 +1217,7 @@ async def unified_search(
             for t in threads:
                 thread_dt = t.created_at
                 if thread_dt.tzinfo is None and since_dt.tzinfo is not None:
-                    from datetime import timezone as tz
-                    thread_dt = thread_dt.replace(tzinfo=tz.utc)
+                    thread_dt = thread_dt.replace(tzinfo=timezone.utc)
                 if thread_dt >= since_dt:
                     filtered.append(t)
             threads = filtered
@@ -1204,8 +1228,7 @@ async def unified_search(
             for t in threads:
                 thread_dt = t.created_at
                 if thread_dt.tzinfo is None and before_dt.tzinfo is not None:
-                    from datetime import timezone as tz
-                    thread_dt = thread_dt.replace(tzinfo=tz.utc)
+                    thread_dt = thread_dt.replace(tzinfo=timezone.utc)
                 if thread_dt < before_dt:
                     filtered.append(t)
             threads = filtered
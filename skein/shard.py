@@ -8,16 +8,48 @@ Provides core functions for creating, cleaning up, and listing SHARDs.
 
 import os
 import re
-import json
+import queue
 import sqlite3
+import subprocess
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# GitPython and (optional) pygit2 each take tens of milliseconds to import, so
+# they load on first use; metadata-only callers such as graft chain lookups
+# never pay for them. Access through _get_git()/_get_pygit2(), which leave the
+# module (or None if not installed) in these globals.
+_UNLOADED: Any = object()
+git: Any = _UNLOADED
+# Optional: libgit2 bindings for in-process object lookups (no git subprocess)
+pygit2: Any = _UNLOADED
+
+
+def _get_git() -> Any:
+    """The GitPython module, imported on first use (None if not installed)."""
+    global git
+    if git is _UNLOADED:
+        try:
+            import git as git_module
+        except ImportError:
+            git_module = None
+        git = git_module
+    return git
+
 
-try:
-    import git
-except ImportError:
-    git = None
+def _get_pygit2() -> Any:
+    """The pygit2 module, imported on first use (None if not installed)."""
+    global pygit2
+    if pygit2 is _UNLOADED:
+        try:
+            import pygit2 as pygit2_module
+        except ImportError:
+            pygit2_module = None
+        pygit2 = pygit2_module
+    return pygit2
 
 
 class ShardError(Exception):
@@ -41,14 +73,53 @@ CREATE TABLE IF NOT EXISTS shards (
     status TEXT DEFAULT 'active',
     tendered_at TIMESTAMP,
     merged_at TIMESTAMP,
-    confidence INTEGER
+    confidence INTEGER,
+    depth INTEGER NOT NULL DEFAULT 0,
+    root_worktree TEXT
 );
 
-CREATE INDEX IF NOT EXISTS idx_shards_parent ON shards(parent_worktree);
+-- Covering indexes for the graft chain walks (name -> parent, parent -> name);
+-- idx_shards_parent_name supersedes the old single-column parent index
+DROP INDEX IF EXISTS idx_shards_parent;
+CREATE INDEX IF NOT EXISTS idx_shards_name_parent ON shards(worktree_name, parent_worktree);
+CREATE INDEX IF NOT EXISTS idx_shards_parent_name ON shards(parent_worktree, worktree_name);
 CREATE INDEX IF NOT EXISTS idx_shards_status ON shards(status);
 CREATE INDEX IF NOT EXISTS idx_shards_base_commit ON shards(base_commit);
 """
 
+# Chain position (hops from the root, and the root's name) is fixed when a row
+# is written, so chain lookups read it instead of walking parent links.
+# Databases created before these columns existed are backfilled once.
+SHARD_DB_CHAIN_COLUMNS = (
+    "ALTER TABLE shards ADD COLUMN depth INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE shards ADD COLUMN root_worktree TEXT",
+)
+
+_BACKFILL_CHAIN_SQL = """
+WITH RECURSIVE up(start, name, parent, hops) AS (
+    SELECT worktree_name, worktree_name, parent_worktree, 0 FROM shards
+    UNION ALL
+    SELECT u.start, s.worktree_name, s.parent_worktree, u.hops + 1
+    FROM shards s JOIN up u ON s.worktree_name = u.parent
+    WHERE u.parent IS NOT NULL AND u.parent != '' AND u.hops < :max_depth
+),
+top(start, name, parent, hops) AS (
+    SELECT start, name, parent, MAX(hops) FROM up GROUP BY start
+)
+UPDATE shards SET
+    root_worktree = (
+        SELECT COALESCE(NULLIF(parent, ''), name) FROM top WHERE top.start = shards.worktree_name
+    ),
+    depth = (
+        SELECT hops + (parent IS NOT NULL AND parent != '') FROM top
+        WHERE top.start = shards.worktree_name
+    )
+"""
+
+SHARD_DB_CHAIN_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_shards_root ON shards(root_worktree, depth)"
+)
+
 
 def _get_db_path() -> Path:
     """Get path to shard database (in .skein directory of project root)."""
@@ -58,17 +129,155 @@ def _get_db_path() -> Path:
     return skein_dir / "shards.db"
 
 
-def _get_db_connection() -> sqlite3.Connection:
-    """Get connection to shard database, creating it if needed."""
-    db_path = _get_db_path()
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+# Applied to every pooled connection. WAL lets readers run alongside the
+# writer; synchronous=NORMAL is durable under WAL without fsync-per-commit.
+SHARD_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
 
-    # Initialize schema if needed
-    conn.executescript(SHARD_DB_SCHEMA)
-    conn.commit()
 
-    return conn
+class _ShardDbPool:
+    """
+    Process-wide connections to one shards.db: a single writer plus idle readers.
+
+    Connections are opened once and reused instead of being opened and closed
+    around every query. Writes are serialized behind a lock and run inside
+    BEGIN IMMEDIATE so the write lock is taken up front.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(
+            maxsize=os.cpu_count() or 4
+        )
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        # Initialize schema if needed
+        self._writer.executescript(SHARD_DB_SCHEMA)
+        self._migrate_chain_columns()
+
+    def _migrate_chain_columns(self) -> None:
+        with self.writer() as conn:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(shards)")}
+            if "root_worktree" not in columns:
+                for statement in SHARD_DB_CHAIN_COLUMNS:
+                    conn.execute(statement)
+                conn.execute(_BACKFILL_CHAIN_SQL, {"max_depth": MAX_GRAFT_CHAIN_DEPTH})
+            conn.execute(SHARD_DB_CHAIN_INDEX)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode - transactions are managed explicitly
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in SHARD_DB_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release_reader(self, conn: sqlite3.Connection) -> None:
+        try:
+            self._readers.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
+
+
+_DB_POOL: Optional[_ShardDbPool] = None
+_DB_POOL_LOCK = threading.Lock()
+
+
+def _get_db_pool() -> _ShardDbPool:
+    """Get the connection pool for the current project's shard database."""
+    global _DB_POOL
+    get_project_root()  # Resolves _SHARD_DB_PATH alongside the root
+    db_path = _SHARD_DB_PATH
+    pool = _DB_POOL
+    if pool is not None and pool.db_path == db_path:
+        return pool
+
+    with _DB_POOL_LOCK:
+        if _DB_POOL is None or _DB_POOL.db_path != db_path:
+            if _DB_POOL is not None:
+                _DB_POOL.close()
+            _DB_POOL = _ShardDbPool(_get_db_path())
+        return _DB_POOL
+
+
+@contextmanager
+def _ro_conn() -> Iterator[sqlite3.Connection]:
+    """Check out a pooled read connection to the shard database."""
+    pool = _get_db_pool()
+    conn = pool.acquire_reader()
+    try:
+        yield conn
+    finally:
+        pool.release_reader(conn)
+
+
+@contextmanager
+def _rw_conn() -> Iterator[sqlite3.Connection]:
+    """Run a write transaction on the shard database (committed on exit)."""
+    with _get_db_pool().writer() as conn:
+        yield conn
+
+
+# A row's chain position derives from its parent's row (or, if the parent has
+# no row, the parent itself is the root one hop up)
+_INSERT_SHARD_SQL = """
+    INSERT OR REPLACE INTO shards
+    (worktree_name, base_commit, created_at, spawned_by, brief_id, description,
+     parent_worktree, status, depth, root_worktree)
+    SELECT :name, :base_commit, :created_at, :spawned_by, :brief_id, :description,
+           :parent, 'active',
+           CASE WHEN :parent IS NULL OR :parent = '' THEN 0 ELSE COALESCE(p.depth, 0) + 1 END,
+           CASE WHEN :parent IS NULL OR :parent = '' THEN :name
+                ELSE COALESCE(p.root_worktree, :parent) END
+    FROM (SELECT 1) LEFT JOIN shards p ON p.worktree_name = :parent
+"""
+
+# Re-recording a row can move its subtree; carry the new root and depths down
+_REROOT_DESCENDANTS_SQL = """
+WITH RECURSIVE sub(name, depth, hops) AS (
+    SELECT worktree_name, depth, 0 FROM shards WHERE worktree_name = :name
+    UNION ALL
+    SELECT s.worktree_name, sub.depth + 1, sub.hops + 1
+    FROM shards s JOIN sub ON s.parent_worktree = sub.name
+    WHERE sub.hops < :max_depth
+)
+UPDATE shards SET
+    root_worktree = (SELECT root_worktree FROM shards WHERE worktree_name = :name),
+    depth = (SELECT MIN(depth) FROM sub WHERE sub.name = shards.worktree_name)
+WHERE worktree_name IN (SELECT name FROM sub) AND worktree_name != :name
+"""
 
 
 def _record_shard_metadata(
@@ -81,38 +290,38 @@ def _record_shard_metadata(
     parent_worktree: Optional[str] = None
 ) -> None:
     """Record shard metadata in SQLite database."""
-    conn = _get_db_connection()
-    try:
-        conn.execute("""
-            INSERT OR REPLACE INTO shards
-            (worktree_name, base_commit, created_at, spawned_by, brief_id, description, parent_worktree, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'active')
-        """, (worktree_name, base_commit, created_at.isoformat(), spawned_by, brief_id, description, parent_worktree))
-        conn.commit()
-    finally:
-        conn.close()
+    with _rw_conn() as conn:
+        conn.execute(_INSERT_SHARD_SQL, {
+            "name": worktree_name,
+            "base_commit": base_commit,
+            "created_at": created_at.isoformat(),
+            "spawned_by": spawned_by,
+            "brief_id": brief_id,
+            "description": description,
+            "parent": parent_worktree,
+        })
+        conn.execute(_REROOT_DESCENDANTS_SQL, {
+            "name": worktree_name,
+            "max_depth": MAX_GRAFT_CHAIN_DEPTH,
+        })
 
 
 def _get_shard_metadata(worktree_name: str) -> Optional[Dict[str, Any]]:
     """Get shard metadata from SQLite database."""
-    conn = _get_db_connection()
-    try:
+    with _ro_conn() as conn:
         cursor = conn.execute(
             "SELECT * FROM shards WHERE worktree_name = ?",
             (worktree_name,)
         )
         row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
-    finally:
-        conn.close()
+    if row:
+        return dict(row)
+    return None
 
 
 def _update_shard_status(worktree_name: str, status: str, **kwargs) -> None:
     """Update shard status in database."""
-    conn = _get_db_connection()
-    try:
+    with _rw_conn() as conn:
         updates = ["status = ?"]
         values = [status]
 
@@ -132,9 +341,6 @@ def _update_shard_status(worktree_name: str, status: str, **kwargs) -> None:
             f"UPDATE shards SET {', '.join(updates)} WHERE worktree_name = ?",
             values
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # =============================================================================
@@ -259,14 +465,16 @@ def _find_project_root() -> Path:
 # Use get_project_root() to access - never access directly.
 _PROJECT_ROOT: Optional[Path] = None
 _WORKTREES_DIR: Optional[Path] = None
+_SHARD_DB_PATH: Optional[Path] = None
 
 
 def get_project_root() -> Path:
     """Get the project root, resolving lazily if needed."""
-    global _PROJECT_ROOT, _WORKTREES_DIR
+    global _PROJECT_ROOT, _WORKTREES_DIR, _SHARD_DB_PATH
     if _PROJECT_ROOT is None:
         _PROJECT_ROOT = _find_project_root()
         _WORKTREES_DIR = _PROJECT_ROOT / "worktrees"
+        _SHARD_DB_PATH = _PROJECT_ROOT / ".skein" / "shards.db"
     return _PROJECT_ROOT
 
 
@@ -287,25 +495,151 @@ def set_project_root(path: str) -> None:
     Args:
         path: Path to the project root (must be a git repository)
     """
-    global _PROJECT_ROOT, _WORKTREES_DIR
+    global _PROJECT_ROOT, _WORKTREES_DIR, _SHARD_DB_PATH
 
     project_path = Path(path).resolve()
+    if project_path == _PROJECT_ROOT:
+        return
     if not (project_path / ".git").exists():
         raise ShardError(f"Not a git repository: {path}")
 
     _PROJECT_ROOT = project_path
     _WORKTREES_DIR = _PROJECT_ROOT / "worktrees"
+    _SHARD_DB_PATH = _PROJECT_ROOT / ".skein" / "shards.db"
+
+
+# Cached repo handles for the current project root. Hot paths issue several
+# git commands per call, so resolve the Repo/Git objects and working dir once.
+_REPO: Optional['git.Repo'] = None
+_REPO_GIT: Optional['git.Git'] = None
+_REPO_CWD: Optional[str] = None
 
 
 def _get_repo() -> 'git.Repo':
-    """Get git.Repo instance for project."""
-    if git is None:
+    """Get git.Repo instance for project (cached per project root)."""
+    global _REPO, _REPO_GIT, _REPO_CWD
+    if _get_git() is None:
         raise ShardError("GitPython not installed. Run: pip install GitPython")
 
+    project_root = get_project_root()
+    if _REPO is not None and _REPO_CWD == str(project_root):
+        return _REPO
+
     try:
-        return git.Repo(get_project_root())
+        repo = git.Repo(project_root)
     except git.InvalidGitRepositoryError:
-        raise ShardError(f"Not a git repository: {get_project_root()}")
+        raise ShardError(f"Not a git repository: {project_root}")
+
+    _REPO = repo
+    _REPO_GIT = repo.git
+    _REPO_CWD = str(project_root)
+    return repo
+
+
+def _open_libgit2_repo() -> Optional['pygit2.Repository']:
+    """Open the project repo with libgit2, or None if pygit2 is unavailable."""
+    if _get_pygit2() is None:
+        return None
+    try:
+        return pygit2.Repository(str(get_project_root()))
+    except Exception:
+        return None
+
+
+def _git_diff(*args: str) -> str:
+    """Run `git diff` via the cached Git handle, bypassing GitPython's kwarg parsing."""
+    _get_repo()
+    return _REPO_GIT.execute(["git", "diff", *args])
+
+
+def _iter_lines(output: str) -> Iterator[str]:
+    """Yield non-empty lines of git output, tolerating trailing newlines."""
+    return (line for line in output.splitlines() if line)
+
+
+class GitCatFileBatch:
+    """
+    Long-lived `git cat-file --batch` process for object reads.
+
+    Each read is a request/response over the child's pipes, so repeated
+    lookups skip git startup and keep its object cache warm.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = str(repo_path)
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", self.repo_path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def read(self, spec: str) -> bytes:
+        """
+        Read the raw contents of an object.
+
+        Args:
+            spec: Any revision spec git accepts (e.g. 'branch^{commit}')
+
+        Returns:
+            Object contents as bytes
+
+        Raises:
+            ShardError: If the object does not exist or git exits
+        """
+        proc = self._ensure_process()
+        proc.stdin.write(spec.encode() + b"\n")
+        proc.stdin.flush()
+
+        # Header: "<sha> <type> <size>" or "<spec> missing"
+        header = proc.stdout.readline()
+        if not header:
+            self.close()
+            raise ShardError(f"git cat-file exited while reading: {spec}")
+        parts = header.split()
+        if len(parts) != 3:
+            raise ShardError(f"Object not found: {spec}")
+
+        size = int(parts[2])
+        data = proc.stdout.read(size + 1)  # Contents plus trailing LF
+        return data[:size]
+
+    def read_commit_message(self, rev: str) -> str:
+        """Read the full message (subject and body) of a commit."""
+        raw = self.read(f"{rev}^{{commit}}")
+        _, _, message = raw.partition(b"\n\n")
+        return message.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Terminate the child process if running."""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except Exception:
+                self._proc.kill()
+            self._proc = None
+
+
+# One batcher per worker thread - the pipes are not safe to share
+_cat_file_local = threading.local()
+
+
+def _get_cat_file_batch() -> GitCatFileBatch:
+    """Get this thread's cat-file batcher for the current project root."""
+    project_root = get_project_root()
+    batcher = getattr(_cat_file_local, "batcher", None)
+    if batcher is None or batcher.repo_path != str(project_root):
+        if batcher is not None:
+            batcher.close()
+        batcher = GitCatFileBatch(project_root)
+        _cat_file_local.batcher = batcher
+    return batcher
 
 
 # Cached git version (None = not yet checked, tuple = parsed version)
@@ -327,7 +661,6 @@ def _get_git_version() -> Tuple[int, ...]:
         return _GIT_VERSION
 
     try:
-        import subprocess
         result = subprocess.run(
             ["git", "--version"],
             capture_output=True,
@@ -403,10 +736,12 @@ def _get_next_sequence(name: str, date: str) -> int:
         return 1
 
     pattern_prefix = f"{name}-{date}-"
-    existing = [
-        d.name for d in worktrees_dir.iterdir()
-        if d.is_dir() and d.name.startswith(pattern_prefix)
-    ]
+    # scandir's cached d_type answers is_dir() without a stat per entry
+    with os.scandir(worktrees_dir) as entries:
+        existing = [
+            d.name for d in entries
+            if d.name.startswith(pattern_prefix) and d.is_dir()
+        ]
 
     if not existing:
         return 1
@@ -516,7 +851,7 @@ def spawn_shard(
         base_commit = repo.git.rev_parse("master")
         repo.git.worktree("add", str(worktree_path), "-b", branch_name)
     except Exception as e:
-        if git and isinstance(e, git.GitCommandError):
+        if _get_git() and isinstance(e, git.GitCommandError):
             raise ShardError(f"Failed to create worktree: {e}")
         raise
 
@@ -791,11 +1126,7 @@ def _parse_worktree_info(worktree_path: str) -> Optional[Dict[str, str]]:
     worktree_name = path.name
 
     # Strip any -graft suffixes before parsing the base name
-    base_name = worktree_name
-    graft_suffix = ""
-    while base_name.endswith("-graft"):
-        base_name = base_name[:-6]  # Remove "-graft"
-        graft_suffix += "-graft"
+    base_name = _strip_graft_suffixes(worktree_name)
 
     # Try to parse base name: {name}-{date}-{seq}
     parts = base_name.rsplit("-", 2)
@@ -841,6 +1172,24 @@ def get_shard_status(worktree_name: str) -> Optional[Dict[str, str]]:
     return None
 
 
+def _shard_snapshot(worktree_name: str) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, Any]]]:
+    """
+    Get worktree info and SQLite metadata for a shard together.
+
+    Entry points that need both should call this once and pass the results
+    down, rather than letting each helper re-list worktrees and re-open the
+    database.
+
+    Returns:
+        (shard_info, metadata) - both None if the worktree doesn't exist;
+        metadata alone is None for legacy shards without SQLite records
+    """
+    shard_info = get_shard_status(worktree_name)
+    if not shard_info:
+        return None, None
+    return shard_info, _get_shard_metadata(Path(worktree_name).name)
+
+
 def get_shard_age_days(shard_info: Dict[str, str]) -> Optional[int]:
     """
     Calculate age of a SHARD in days from its date string.
@@ -952,10 +1301,14 @@ def get_shard_git_info(worktree_name: str) -> Dict:
         - diffstat: git diff --stat output (str)
         - uncommitted: list of uncommitted file changes
     """
-    shard_info = get_shard_status(worktree_name)
+    shard_info, metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         return {}
+    return _collect_shard_git_info(shard_info, metadata)
+
 
+def _collect_shard_git_info(shard_info: Dict[str, str], metadata: Optional[Dict[str, Any]]) -> Dict:
+    """Build get_shard_git_info() result from an already-loaded snapshot."""
     result = {
         "commits_ahead": 0,
         "working_tree": "unknown",
@@ -971,7 +1324,7 @@ def get_shard_git_info(worktree_name: str) -> Dict:
         worktree_path = shard_info["worktree_path"]
 
         # Get base reference (base_commit from SQLite, or fall back to master)
-        base_ref = _get_shard_base_ref(worktree_name)
+        base_ref = _base_ref_from_metadata(metadata)
 
         # Commits ahead of base_ref (agent's actual commits)
         try:
@@ -983,7 +1336,7 @@ def get_shard_git_info(worktree_name: str) -> Dict:
         # Working tree status (check for uncommitted changes)
         # Must run git status FROM the worktree, not pass path to main repo
         try:
-            if git is None:
+            if _get_git() is None:
                 raise ShardError("GitPython not installed")
             worktree_repo = git.Repo(worktree_path)
             status = worktree_repo.git.status("--porcelain")
@@ -1015,19 +1368,18 @@ def get_shard_git_info(worktree_name: str) -> Dict:
         # Commit log (commits on branch since base_ref - agent's actual work)
         try:
             log_output = repo.git.log("--oneline", f"{base_ref}..{branch}")
-            if log_output.strip():
-                for line in log_output.strip().split("\n"):
-                    parts = line.split(" ", 1)
-                    sha = parts[0]
-                    msg = parts[1] if len(parts) > 1 else ""
-                    result["commit_log"].append((sha, msg))
+            for line in _iter_lines(log_output):
+                parts = line.split(" ", 1)
+                sha = parts[0]
+                msg = parts[1] if len(parts) > 1 else ""
+                result["commit_log"].append((sha, msg))
         except:
             pass
 
         # Diffstat (files changed between base_ref and branch - agent's actual work)
         try:
             if result["commits_ahead"] > 0:
-                diffstat = repo.git.diff("--stat", f"{base_ref}..{branch}")
+                diffstat = _git_diff("--stat", f"{base_ref}..{branch}")
                 result["diffstat"] = diffstat.strip()
         except:
             pass
@@ -1035,12 +1387,11 @@ def get_shard_git_info(worktree_name: str) -> Dict:
         # Uncommitted changes in worktree
         # Must run git status FROM the worktree, not pass path to main repo
         try:
-            if git is None:
+            if _get_git() is None:
                 raise ShardError("GitPython not installed")
             worktree_repo = git.Repo(worktree_path)
             status = worktree_repo.git.status("--porcelain")
-            if status.strip():
-                result["uncommitted"] = [f for f in status.strip().split("\n") if f]
+            result["uncommitted"] = list(_iter_lines(status))
         except ShardError:
             pass  # Already handled
         except Exception:
@@ -1066,7 +1417,7 @@ def get_tender_metadata(worktree_name: str) -> Optional[Dict]:
         Dict with tender metadata or None if SHARD not found
         Contains: commits, files_modified, branch_name, etc.
     """
-    shard_info = get_shard_status(worktree_name)
+    shard_info, shard_metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         return None
 
@@ -1087,7 +1438,7 @@ def get_tender_metadata(worktree_name: str) -> Optional[Dict]:
         branch = shard_info["branch_name"]
 
         # Get base reference (base_commit from SQLite, or fall back to master)
-        base_ref = _get_shard_base_ref(worktree_name)
+        base_ref = _base_ref_from_metadata(shard_metadata)
 
         # Get commit count on this branch (since base_ref)
         try:
@@ -1100,17 +1451,14 @@ def get_tender_metadata(worktree_name: str) -> Optional[Dict]:
         # Get list of modified files (agent's actual work from base_ref)
         try:
             # Files changed between base_ref and this branch
-            changed_files = repo.git.diff("--name-only", base_ref, branch)
-            if changed_files:
-                metadata["files_modified"] = changed_files.strip().split("\n")
-            else:
-                metadata["files_modified"] = []
+            changed_files = _git_diff("--name-only", base_ref, branch)
+            metadata["files_modified"] = list(_iter_lines(changed_files))
         except:
             metadata["files_modified"] = []
 
         # Get last commit message
         try:
-            last_commit = repo.git.log("-1", "--pretty=%B", branch)
+            last_commit = _get_cat_file_batch().read_commit_message(branch)
             metadata["last_commit_message"] = last_commit.strip()
         except:
             metadata["last_commit_message"] = ""
@@ -1125,6 +1473,10 @@ def get_tender_metadata(worktree_name: str) -> Optional[Dict]:
     return metadata
 
 
+# merge-tree section header plus the base-file line that follows it
+_CHANGED_IN_BOTH_RE = re.compile(r"^[ \t]*changed in both[ \t]*\n([^\n]*)", re.MULTILINE)
+
+
 def get_shard_drift_info(worktree_name: str) -> Dict[str, Any]:
     """
     Get comprehensive drift information for a shard.
@@ -1149,13 +1501,11 @@ def get_shard_drift_info(worktree_name: str) -> Dict[str, Any]:
         >>> elif info['master_commits_ahead'] > 10:
         ...     print("Shard is stale, consider grafting")
     """
-    shard_info = get_shard_status(worktree_name)
+    # Worktree info plus metadata from SQLite
+    shard_info, metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         return {}
 
-    # Get metadata from SQLite
-    metadata = _get_shard_metadata(worktree_name)
-
     result = {
         "worktree_name": worktree_name,
         "branch_name": shard_info["branch_name"],
@@ -1166,7 +1516,7 @@ def get_shard_drift_info(worktree_name: str) -> Dict[str, Any]:
         "master_commits_ahead": 0,
         "master_notable_changes": [],
         "is_stale": False,
-        "is_nested": is_nested_shard(worktree_name),
+        "is_nested": _is_nested(worktree_name, shard_info, metadata),
         "conflict_status": "unknown",
         "conflict_files": [],
         "work_diff_stat": None,
@@ -1201,33 +1551,32 @@ def get_shard_drift_info(worktree_name: str) -> Dict[str, Any]:
             try:
                 if result["master_commits_ahead"] > 0:
                     # Get file stats for changes on master
-                    name_status = repo.git.diff("--name-status", f"{base_commit}..master")
+                    name_status = _git_diff("--name-status", f"{base_commit}..master")
                     notable = []
-                    for line in name_status.strip().split("\n")[:10]:  # Limit to 10
-                        if line:
-                            parts = line.split("\t", 1)
-                            if len(parts) == 2:
-                                status, file_path = parts
-                                if status == "D":
-                                    notable.append(f"deleted: {file_path}")
-                                elif status == "A":
-                                    notable.append(f"added: {file_path}")
-                                elif status.startswith("R"):
-                                    notable.append(f"renamed: {file_path}")
+                    for line in islice(_iter_lines(name_status), 10):  # Limit to 10
+                        parts = line.split("\t", 1)
+                        if len(parts) == 2:
+                            status, file_path = parts
+                            if status == "D":
+                                notable.append(f"deleted: {file_path}")
+                            elif status == "A":
+                                notable.append(f"added: {file_path}")
+                            elif status.startswith("R"):
+                                notable.append(f"renamed: {file_path}")
                     result["master_notable_changes"] = notable
             except:
                 pass
 
             # Get work diff stat (agent's actual changes from base)
             try:
-                work_stat = repo.git.diff("--stat", f"{base_commit}..{branch}")
+                work_stat = _git_diff("--stat", f"{base_commit}..{branch}")
                 result["work_diff_stat"] = work_stat.strip() if work_stat.strip() else None
             except:
                 pass
 
         # Get integration diff stat (what would merge with current master)
         try:
-            integration_stat = repo.git.diff("--stat", f"master...{branch}")
+            integration_stat = _git_diff("--stat", f"master...{branch}")
             result["integration_diff_stat"] = integration_stat.strip() if integration_stat.strip() else None
         except:
             pass
@@ -1243,14 +1592,11 @@ def get_shard_drift_info(worktree_name: str) -> Dict[str, Any]:
                 result["conflict_status"] = "conflict"
                 # Parse conflict files from merge-tree output
                 conflict_files = set()
-                lines = merge_output.split("\n")
-                for i, line in enumerate(lines):
-                    if line.strip() == "changed in both":
-                        # Next line has file info
-                        if i + 1 < len(lines):
-                            parts = lines[i + 1].split()
-                            if len(parts) >= 4:
-                                conflict_files.add(" ".join(parts[3:]))
+                for match in _CHANGED_IN_BOTH_RE.finditer(merge_output):
+                    # Line after the header: "  base   100644 SHA filename"
+                    parts = match.group(1).split()
+                    if len(parts) >= 4:
+                        conflict_files.add(" ".join(parts[3:]))
                 result["conflict_files"] = list(conflict_files)
             else:
                 result["conflict_status"] = "clean"
@@ -1282,7 +1628,11 @@ def _get_shard_base_ref(worktree_name: str) -> str:
     Returns:
         Git ref string (commit SHA or 'master')
     """
-    metadata = _get_shard_metadata(worktree_name)
+    return _base_ref_from_metadata(_get_shard_metadata(worktree_name))
+
+
+def _base_ref_from_metadata(metadata: Optional[Dict[str, Any]]) -> str:
+    """Resolve the diff base ref from already-loaded shard metadata."""
     if metadata and metadata.get("base_commit"):
         return metadata["base_commit"]
     # Legacy shard without metadata - fall back to master
@@ -1303,24 +1653,23 @@ def get_shard_work_diff(worktree_name: str, stat_only: bool = False) -> Optional
     Returns:
         Git diff output as string, or None if no changes or no metadata
     """
-    shard_info = get_shard_status(worktree_name)
+    shard_info, metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         return None
 
-    base_ref = _get_shard_base_ref(worktree_name)
+    base_ref = _base_ref_from_metadata(metadata)
     if base_ref == "master":
         # No base_commit metadata - fall back to integration diff
         return get_shard_diff(worktree_name, stat_only=stat_only)
 
     try:
-        repo = _get_repo()
         branch = shard_info["branch_name"]
 
         # Work diff: base_ref..branch (base_ref is the actual base commit SHA)
         if stat_only:
-            diff_output = repo.git.diff("--stat", f"{base_ref}..{branch}")
+            diff_output = _git_diff("--stat", f"{base_ref}..{branch}")
         else:
-            diff_output = repo.git.diff(f"{base_ref}..{branch}")
+            diff_output = _git_diff(f"{base_ref}..{branch}")
 
         return diff_output if diff_output.strip() else None
 
@@ -1348,15 +1697,14 @@ def get_shard_diff(worktree_name: str, stat_only: bool = False, integration: boo
         return None
 
     try:
-        repo = _get_repo()
         branch = shard_info["branch_name"]
 
         # Get diff between master and shard branch
         diff_range = f"master...{branch}" if integration else f"master..{branch}"
         if stat_only:
-            diff_output = repo.git.diff("--stat", diff_range)
+            diff_output = _git_diff("--stat", diff_range)
         else:
-            diff_output = repo.git.diff(diff_range)
+            diff_output = _git_diff(diff_range)
         return diff_output if diff_output.strip() else None
 
     except Exception as e:
@@ -1366,7 +1714,8 @@ def get_shard_diff(worktree_name: str, stat_only: bool = False, integration: boo
 def merge_shard(
     worktree_name: str,
     caller_cwd: Optional[str] = None,
-    project_root: Optional[str] = None
+    project_root: Optional[str] = None,
+    fast_forward: bool = False
 ) -> Dict[str, Any]:
     """
     Merge shard branch into master and cleanup worktree.
@@ -1374,12 +1723,17 @@ def merge_shard(
     Checks for uncommitted changes and merge conflicts before proceeding.
     If clean: checks out master, merges branch with --no-ff, cleans up worktree and branch.
 
+    With fast_forward=True, a branch that is a strict descendant of master is
+    integrated by moving the master ref instead (no checkout, no merge commit).
+    Branches that master has moved past still get the --no-ff merge.
+
     Args:
         worktree_name: Worktree directory name (e.g., 'fix-auth-bug-20251109-001')
         caller_cwd: Optional path to check for self-deletion. If provided, merge will
             be refused if this path is inside the target worktree. This is used to prevent
             agents from merging their own worktree after cd-ing elsewhere.
         project_root: Optional path to git repo. If not provided, auto-detects.
+        fast_forward: If True, fast-forward master when no merge is necessary.
 
     Returns:
         Dict with:
@@ -1391,7 +1745,7 @@ def merge_shard(
     if project_root:
         set_project_root(project_root)
 
-    shard_info = get_shard_status(worktree_name)
+    shard_info, metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         raise ShardError(f"SHARD not found: {worktree_name}")
 
@@ -1424,7 +1778,7 @@ def merge_shard(
     repo = _get_repo()
 
     # Check for uncommitted changes in the worktree
-    git_info = get_shard_git_info(worktree_name)
+    git_info = _collect_shard_git_info(shard_info, metadata)
     if git_info.get("working_tree") == "dirty":
         uncommitted = git_info.get("uncommitted", [])
         return {
@@ -1496,20 +1850,35 @@ def merge_shard(
 
     merge_succeeded = False
     try:
-        # Checkout master
-        repo.git.checkout("master")
+        if fast_forward and _is_fast_forward(repo, branch_name):
+            # No master activity since the branch point - just move the pointer
+            try:
+                if original_ref == "master":
+                    # master is checked out here; let git update index and tree too
+                    repo.git.merge("--ff-only", branch_name)
+                else:
+                    # Compare-and-swap on the old master SHA guards against races
+                    old_master = repo.git.rev_parse("master")
+                    branch_sha = repo.git.rev_parse(branch_name)
+                    repo.git.update_ref("refs/heads/master", branch_sha, old_master)
+                merge_succeeded = True
+            except Exception as ff_error:
+                raise ShardError(f"Fast-forward failed: {ff_error}")
+        else:
+            # Checkout master
+            repo.git.checkout("master")
 
-        # Merge with --no-ff to preserve branch history
-        try:
-            repo.git.merge("--no-ff", branch_name, "-m", f"Merge {branch_name}")
-            merge_succeeded = True
-        except Exception as merge_error:
-            # If merge fails, abort and restore
+            # Merge with --no-ff to preserve branch history
             try:
-                repo.git.merge("--abort")
-            except Exception:
-                pass
-            raise ShardError(f"Merge failed: {merge_error}")
+                repo.git.merge("--no-ff", branch_name, "-m", f"Merge {branch_name}")
+                merge_succeeded = True
+            except Exception as merge_error:
+                # If merge fails, abort and restore
+                try:
+                    repo.git.merge("--abort")
+                except Exception:
+                    pass
+                raise ShardError(f"Merge failed: {merge_error}")
 
         # Cleanup worktree and branch
         try:
@@ -1544,54 +1913,86 @@ def merge_shard(
                 pass  # Best effort restoration
 
 
+def _is_fast_forward(repo: 'git.Repo', branch_name: str) -> bool:
+    """Check whether master is an ancestor of branch (no merge necessary)."""
+    try:
+        repo.git.merge_base("--is-ancestor", "master", branch_name)
+        return True
+    except Exception:
+        # Non-zero exit means master has commits the branch lacks
+        return False
+
+
 # =============================================================================
 # GRAFT WORKFLOW - Conflict Resolution
 # =============================================================================
 
+# Trailing run of -graft suffixes (one per graft level)
+_GRAFT_SUFFIX_RE = re.compile(r"(?:-graft)+$")
+
+# Upper bound on parent-link hops when walking a graft chain. This cap is the
+# only cycle guard: parent_worktree may name a worktree with no row yet (or a
+# since-pruned one), so it cannot be a foreign key, and no walk keeps a
+# visited set.
+MAX_GRAFT_CHAIN_DEPTH = 64
+
 def get_graft_chain_root(worktree_name: str) -> str:
     """
-    Get the root worktree name by following parent_worktree links in SQLite.
+    Get the root worktree name recorded for worktree_name in SQLite.
 
     Falls back to name parsing (stripping -graft suffixes) for legacy shards
     without SQLite metadata.
     """
-    conn = _get_db_connection()
-    try:
-        current = worktree_name
-        visited = set()  # Prevent infinite loops
-        found_in_db = False
-
-        while current and current not in visited:
-            visited.add(current)
-            cursor = conn.execute(
-                "SELECT parent_worktree FROM shards WHERE worktree_name = ?",
-                (current,)
-            )
-            row = cursor.fetchone()
-
-            if row:
-                found_in_db = True
-                if row["parent_worktree"]:
-                    current = row["parent_worktree"]
-                else:
-                    # No parent - this is the root
-                    break
-            else:
-                # Not in database - use fallback
-                break
+    # If we found a root via SQLite, return it
+    root = _lookup_graft_root(worktree_name)
+    if root:
+        return root
 
-        # If we found a root via SQLite, return it
-        if found_in_db and current:
-            return current
+    # Fallback for legacy shards: strip -graft suffixes
+    return _strip_graft_suffixes(worktree_name)
 
-    finally:
-        conn.close()
 
-    # Fallback for legacy shards: strip -graft suffixes
-    name = worktree_name
-    while name.endswith("-graft"):
-        name = name[:-6]  # Remove "-graft"
-    return name
+# Both lookups are single indexed queries on the stored root_worktree/depth
+# columns, so they read SQLite directly and always see other processes' writes.
+def _lookup_graft_root(worktree_name: str) -> Optional[str]:
+    """Root of worktree_name's chain per SQLite, or None if it has no row."""
+    with _ro_conn() as conn:
+        row = conn.execute(
+            "SELECT root_worktree FROM shards WHERE worktree_name = ?",
+            (worktree_name,)
+        ).fetchone()
+    return row["root_worktree"] if row else None
+
+
+def _lookup_graft_chain(root: str) -> Tuple[str, ...]:
+    """Chain names root -> leaf per SQLite (not filtered by existence)."""
+    with _ro_conn() as conn:
+        rows = conn.execute(
+            "SELECT worktree_name, parent_worktree FROM shards "
+            "WHERE root_worktree = ? AND worktree_name != ? ORDER BY depth, rowid",
+            (root, root)
+        ).fetchall()
+    # Follow the first recorded child at each level down from the root
+    names = [root]
+    for row in rows:
+        if row["parent_worktree"] == names[-1]:
+            names.append(row["worktree_name"])
+    return tuple(names)
+
+
+def _strip_graft_suffixes(worktree_name: str) -> str:
+    """Remove trailing -graft suffixes (name-based root for legacy shards)."""
+    match = _GRAFT_SUFFIX_RE.search(worktree_name)
+    return worktree_name[:match.start()] if match else worktree_name
+
+
+def _existing_worktree_names(worktrees_dir: Path) -> frozenset:
+    """Snapshot entry names in worktrees_dir with a single directory read."""
+    try:
+        with os.scandir(worktrees_dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
 
 
 def get_graft_chain(worktree_name: str) -> List[str]:
@@ -1601,57 +2002,30 @@ def get_graft_chain(worktree_name: str) -> List[str]:
     Returns list of worktree names from root to current, e.g.:
     ['fix-bug-20260112-001', 'fix-bug-20260112-001-graft', 'fix-bug-20260112-001-graft-graft']
 
-    Uses SQLite parent_worktree column for chain tracking, with fallback to
-    name parsing for legacy shards without metadata.
+    Uses the root_worktree/depth columns recorded with each SQLite row, with
+    fallback to name parsing for legacy shards without metadata.
     """
-    worktrees_dir = get_worktrees_dir()
-    conn = _get_db_connection()
+    root = get_graft_chain_root(worktree_name)
+    names = list(_lookup_graft_chain(root))
+    return _finish_graft_chain(names, _existing_worktree_names(get_worktrees_dir()))
 
-    try:
-        # First, find the root by following parent links up
-        root = get_graft_chain_root(worktree_name)
-
-        # Now build chain by following children down
-        chain = []
-        current = root
-
-        while current:
-            path = worktrees_dir / current
-            if path.exists():
-                chain.append(current)
-
-            # Find child (shard with parent_worktree = current)
-            cursor = conn.execute(
-                "SELECT worktree_name FROM shards WHERE parent_worktree = ?",
-                (current,)
-            )
-            row = cursor.fetchone()
 
-            if row:
-                current = row["worktree_name"]
-            else:
-                # No child in SQLite - try legacy name-based detection
-                next_graft = f"{current}-graft"
-                if (worktrees_dir / next_graft).exists():
-                    current = next_graft
-                else:
-                    break
-
-        return chain
+def _finish_graft_chain(names: List[str], existing: frozenset) -> List[str]:
+    """Extend a SQLite chain with legacy -graft names, keep only existing worktrees."""
+    # No further child in SQLite - try legacy name-based detection
+    current = names[-1]
+    while f"{current}-graft" in existing and len(names) <= MAX_GRAFT_CHAIN_DEPTH:
+        current = f"{current}-graft"
+        names.append(current)
 
-    finally:
-        conn.close()
+    return [name for name in names if name in existing]
 
 
 def get_graft_depth(worktree_name: str) -> int:
     """Get depth in graft chain (0 = original, 1 = first graft, etc)."""
     # Count only suffix -graft occurrences, not -graft in the name part
-    depth = 0
-    name = worktree_name
-    while name.endswith("-graft"):
-        depth += 1
-        name = name[:-6]  # Remove "-graft"
-    return depth
+    match = _GRAFT_SUFFIX_RE.search(worktree_name)
+    return len(match.group(0)) // len("-graft") if match else 0
 
 
 def is_graft(worktree_name: str) -> bool:
@@ -1681,11 +2055,23 @@ def is_nested_shard(worktree_name: str) -> bool:
     Returns:
         True if this is a nested shard
     """
+    # Grafts are inherently nested - skip the metadata read entirely
+    if is_graft(worktree_name):
+        return True
+
+    return _is_nested(worktree_name, None, _get_shard_metadata(worktree_name))
+
+
+def _is_nested(
+    worktree_name: str,
+    shard_info: Optional[Dict[str, str]],
+    metadata: Optional[Dict[str, Any]]
+) -> bool:
+    """is_nested_shard() against an already-loaded snapshot (shard_info may be None)."""
     # Grafts are inherently nested - they have a parent worktree
     if is_graft(worktree_name):
         return True
 
-    metadata = _get_shard_metadata(worktree_name)
     if not metadata:
         return False
 
@@ -1701,7 +2087,8 @@ def is_nested_shard(worktree_name: str) -> bool:
     if not base_commit or not created_at:
         return False
 
-    shard_info = get_shard_status(worktree_name)
+    if shard_info is None:
+        shard_info = get_shard_status(worktree_name)
     if not shard_info:
         return False
 
@@ -1716,14 +2103,15 @@ def is_nested_shard(worktree_name: str) -> bool:
         # the base and the branch tip that are not on master and predate creation.
         # This catches nested shards where master hasn't moved.
         if base_commit == actual_merge_base:
-            # Get commits on branch not on master, with timestamps
-            # Format: "SHA TIMESTAMP" where TIMESTAMP is Unix epoch
+            # Get commit timestamps (Unix epoch) on branch not on master,
+            # NUL-separated raw bytes so no decode/line split is needed
             commits_output = repo.git.log(
-                "--format=%H %ct",
+                "-z", "--format=%ct",
                 f"{actual_merge_base}..{branch}",
-                "--not", "master"
+                "--not", "master",
+                stdout_as_string=False,
             )
-            if commits_output.strip():
+            if commits_output:
                 # Parse creation time
                 from datetime import datetime as dt
                 try:
@@ -1736,13 +2124,10 @@ def is_nested_shard(worktree_name: str) -> bool:
                     return False
 
                 # Check if any commit predates shard creation
-                for line in commits_output.strip().split('\n'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        commit_ts = int(parts[1])
-                        # Allow 60 second grace period for timing skew
-                        if commit_ts < created_ts - 60:
-                            return True
+                for stamp in commits_output.split(b"\0"):
+                    # Allow 60 second grace period for timing skew
+                    if stamp and int(stamp) < created_ts - 60:
+                        return True
 
     except Exception:
         pass
@@ -1750,6 +2135,54 @@ def is_nested_shard(worktree_name: str) -> bool:
     return False
 
 
+def _cherry_pick_into_graft(
+    repo: 'git.Repo',
+    graft_worktree_path: Path,
+    graft_branch_name: str,
+    commit_range: str
+) -> List[str]:
+    """
+    Cherry-pick commit_range into a fresh graft worktree.
+
+    Returns the conflicted files (empty on a clean apply). On any other
+    failure the worktree and branch are removed and ShardError is raised.
+    """
+    # Cherry-pick the whole range in one git process (oldest first).
+    # On conflict git stops at the offending commit and leaves it for resolution.
+    conflict_files = []
+    try:
+        if _get_git() is None:
+            raise ShardError("GitPython not installed")
+        graft_repo = git.Repo(str(graft_worktree_path))
+
+        try:
+            graft_repo.git.cherry_pick(commit_range)
+        except Exception as e:
+            # Cherry-pick failed - likely conflicts
+            if "conflict" in str(e).lower() or "CONFLICT" in str(e):
+                # Get list of conflicted files (every unmerged path, any mode)
+                try:
+                    unmerged = graft_repo.git.diff("--name-only", "--diff-filter=U")
+                    conflict_files = list(_iter_lines(unmerged))
+                except git.GitCommandError:
+                    pass
+            else:
+                raise ShardError(f"Cherry-pick failed: {e}")
+
+    except Exception as e:
+        # If something went wrong, try to clean up
+        try:
+            repo.git.worktree("remove", "--force", str(graft_worktree_path))
+            repo.git.branch("-D", graft_branch_name)
+        except:
+            pass
+        if isinstance(e, ShardError):
+            raise
+        raise ShardError(f"Failed to apply commits: {e}")
+
+    return conflict_files
+
+
 def graft_shard(
     worktree_name: str,
     project_root: Optional[str] = None
@@ -1776,19 +2209,17 @@ def graft_shard(
     if project_root:
         set_project_root(project_root)
 
-    # Verify source worktree exists
-    shard_info = get_shard_status(worktree_name)
+    # Verify source worktree exists and get metadata for base commit
+    shard_info, source_metadata = _shard_snapshot(worktree_name)
     if not shard_info:
         raise ShardError(f"Worktree not found: {worktree_name}")
 
-    # Get metadata for base commit
-    source_metadata = _get_shard_metadata(worktree_name)
-
     worktrees_dir = get_worktrees_dir()
     repo = _get_repo()
 
-    # Generate graft name (append -graft)
+    # Generate graft name (append -graft); it sits one level below its source
     graft_worktree_name = f"{worktree_name}-graft"
+    chain_depth = get_graft_depth(worktree_name) + 1
     graft_branch_name = f"shard-{graft_worktree_name}"
     graft_worktree_path = worktrees_dir / graft_worktree_name
 
@@ -1801,36 +2232,54 @@ def graft_shard(
 
     # Get commits from source shard
     source_branch = shard_info["branch_name"]
-
-    # Find base commit (from metadata or merge-base with master)
-    if source_metadata and source_metadata.get("base_commit"):
-        base_commit = source_metadata["base_commit"]
+    base_commit = source_metadata.get("base_commit") if source_metadata else None
+
+    # Resolve base commit, commit count and master HEAD. With pygit2 these are
+    # in-process object lookups; otherwise each is a git subprocess.
+    lg2_repo = _open_libgit2_repo()
+    if lg2_repo is not None:
+        master_oid = lg2_repo.revparse_single("master").id
+        branch_oid = lg2_repo.revparse_single(source_branch).id
+        if not base_commit:
+            # Legacy shard without metadata - use merge-base
+            base_commit = str(lg2_repo.merge_base(master_oid, branch_oid))
+        walker = lg2_repo.walk(branch_oid)
+        walker.hide(lg2_repo.revparse_single(base_commit).id)
+        commit_count = sum(1 for _ in walker)
+        new_base_commit = str(master_oid)
     else:
-        # Legacy shard without metadata - use merge-base
-        base_commit = repo.git.merge_base("master", source_branch)
+        if not base_commit:
+            # Legacy shard without metadata - use merge-base
+            base_commit = repo.git.merge_base("master", source_branch)
+        commit_count = int(repo.git.rev_list("--count", f"{base_commit}..{source_branch}"))
+        new_base_commit = repo.git.rev_parse("master")
 
-    # Get list of commits to cherry-pick (in reverse order - oldest first)
-    commits_output = repo.git.rev_list("--reverse", f"{base_commit}..{source_branch}")
-    commits = commits_output.strip().split("\n") if commits_output.strip() else []
+    # Commits to cherry-pick: everything on the source branch since its base
+    commit_range = f"{base_commit}..{source_branch}"
 
-    if not commits:
+    if not commit_count:
         raise ShardError(
             f"No commits to graft from {worktree_name}\n"
             f"The shard has no changes relative to its base."
         )
 
-    # Get current master HEAD for new base_commit
-    new_base_commit = repo.git.rev_parse("master")
+    created_at = datetime.now()
 
-    # Create worktree from current master
+    # Create worktree from current master (new_base_commit is its HEAD).
+    # This stays a full checkout: the graft is where conflicts get resolved
+    # and tests get run, so a --no-checkout/sparse tree would hide files
+    # the resolver needs, and cherry-pick requires a populated index anyway.
     try:
         repo.git.worktree("add", str(graft_worktree_path), "-b", graft_branch_name, "master")
     except Exception as e:
         raise ShardError(f"Failed to create graft worktree: {e}")
 
-    created_at = datetime.now()
+    conflict_files = _cherry_pick_into_graft(
+        repo, graft_worktree_path, graft_branch_name, commit_range
+    )
 
-    # Record graft metadata
+    # Record metadata once the graft worktree is usable (clean or stopped at a
+    # conflict), so the shard DB write lock is only held for the row write
     _record_shard_metadata(
         worktree_name=graft_worktree_name,
         base_commit=new_base_commit,
@@ -1839,51 +2288,15 @@ def graft_shard(
         description=f"Graft of {worktree_name} for conflict resolution"
     )
 
-    # Cherry-pick commits
-    conflict_files = []
-    try:
-        if git is None:
-            raise ShardError("GitPython not installed")
-        graft_repo = git.Repo(str(graft_worktree_path))
-
-        for commit in commits:
-            try:
-                graft_repo.git.cherry_pick(commit)
-            except Exception as e:
-                # Cherry-pick failed - likely conflicts
-                if "conflict" in str(e).lower() or "CONFLICT" in str(e):
-                    # Get list of conflicted files
-                    try:
-                        status = graft_repo.git.status("--porcelain")
-                        for line in status.split("\n"):
-                            if line.startswith("UU ") or line.startswith("AA "):
-                                conflict_files.append(line[3:])
-                    except:
-                        pass
-                    break
-                else:
-                    raise ShardError(f"Cherry-pick failed: {e}")
-
-    except ShardError:
-        raise
-    except Exception as e:
-        # If something went wrong, try to clean up
-        try:
-            repo.git.worktree("remove", "--force", str(graft_worktree_path))
-            repo.git.branch("-D", graft_branch_name)
-        except:
-            pass
-        raise ShardError(f"Failed to apply commits: {e}")
-
     result = {
         "success": len(conflict_files) == 0,
         "graft_worktree_name": graft_worktree_name,
         "graft_worktree_path": str(graft_worktree_path),
         "graft_branch_name": graft_branch_name,
         "source_worktree_name": worktree_name,
-        "commits_applied": len(commits),
+        "commits_applied": commit_count,
         "conflicts": conflict_files,
-        "chain_depth": get_graft_depth(graft_worktree_name),
+        "chain_depth": chain_depth,
     }
 
     if conflict_files:
@@ -1925,7 +2338,7 @@ def cleanup_graft_chain(
         set_project_root(project_root)
 
     root = get_graft_chain_root(worktree_name)
-    chain = get_graft_chain(root)
+    chain = get_graft_chain(worktree_name)
 
     if not chain:
         raise ShardError(f"No worktrees found in chain for: {worktree_name}")
@@ -1949,6 +2362,33 @@ def cleanup_graft_chain(
     }
 
 
+# cwd -> worktree root (or None), so repeated detection skips the upward walk
+_WORKTREE_ROOT_CACHE: Dict[Path, Optional[Path]] = {}
+
+
+def _find_worktree_root(cwd: Path) -> Optional[Path]:
+    """Find the enclosing worktree root (dir with a .git file), memoized by cwd."""
+    if cwd in _WORKTREE_ROOT_CACHE:
+        return _WORKTREE_ROOT_CACHE[cwd]
+
+    # Try to find the worktree root (should contain .git file pointing to main repo)
+    current = cwd
+    worktree_root = None
+
+    while current != current.parent:
+        git_file = current / ".git"
+        if git_file.is_file():
+            # This is a worktree (not main repo which has .git directory)
+            worktree_root = current
+            break
+        current = current.parent
+
+    # Only positive results are stable; a worktree may still be created here
+    if worktree_root is not None:
+        _WORKTREE_ROOT_CACHE[cwd] = worktree_root
+    return worktree_root
+
+
 def detect_shard_environment() -> Optional[Dict[str, str]]:
     """
     Detect if currently running in a SHARD worktree.
@@ -1966,23 +2406,12 @@ def detect_shard_environment() -> Optional[Dict[str, str]]:
     if "worktrees" not in str(cwd):
         return None
 
-    # Try to find the worktree root (should contain .git file pointing to main repo)
-    current = cwd
-    worktree_root = None
-
-    while current != current.parent:
-        git_file = current / ".git"
-        if git_file.exists() and git_file.is_file():
-            # This is a worktree (not main repo which has .git directory)
-            worktree_root = current
-            break
-        current = current.parent
-
+    worktree_root = _find_worktree_root(cwd)
     if not worktree_root:
         return None
 
     # Check if this worktree is in our worktrees directory
-    if not str(worktree_root).startswith(str(get_worktrees_dir())):
+    if worktree_root.parent != get_worktrees_dir():
         return None
 
     # Get worktree name
@@ -1994,6 +2423,7 @@ def detect_shard_environment() -> Optional[Dict[str, str]]:
 
 if __name__ == "__main__":
     # Simple CLI for testing
+    import json
     import sys
 
     if len(sys.argv) < 2:
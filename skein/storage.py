@@ -5,11 +5,15 @@ Multi-project support via ~/.skein/projects.json registry.
 
 import sqlite3
 import json
+import hashlib
 import logging
 import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from .models import AgentInfo, Site, Folio, Thread, LogLine
@@ -20,9 +24,37 @@ try:
 except ImportError:
     KNURL_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# JSON encoding: orjson when installed, stdlib otherwise. Both accept str or
+# bytes input; dumps returns str (SQLite columns stay TEXT for JSON1 queries).
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+
 def compute_folio_hash(folio: Folio) -> str:
     """Compute content-addressable hash of folio's immutable fields."""
     if not KNURL_AVAILABLE:
@@ -49,8 +81,8 @@ def load_project_registry() -> Dict[str, Dict[str, Any]]:
         return {}
 
     try:
-        with open(registry_file) as f:
-            data = json.load(f)
+        with open(registry_file, 'rb') as f:
+            data = _json_loads(f.read())
             return data.get('projects', {})
     except Exception as e:
         logger.error(f"Failed to load project registry: {e}")
@@ -82,6 +114,59 @@ def get_data_dir_for_project(project_id: Optional[str] = None) -> Path:
 
 # SQLite Database for Logs
 
+# Applied once to each new connection (connection-scoped settings).
+# synchronous=NORMAL skips the fsync per commit under WAL; a power loss can
+# drop the last few committed log batches, which is acceptable for logs.
+LOG_DB_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Long-lived connections, one per (thread, database file). LogDatabase objects
+# are created per request, so connections are cached at module level rather
+# than on the instance; each stays open until close() or process exit.
+_thread_connections = threading.local()
+
+
+def _get_thread_connections() -> Dict[str, sqlite3.Connection]:
+    conns = getattr(_thread_connections, "by_path", None)
+    if conns is None:
+        conns = _thread_connections.by_path = {}
+    return conns
+
+
+@contextmanager
+def _cached_connection(db_path: Path):
+    """Get this thread's cached connection to db_path (opened on first use)."""
+    conns = _get_thread_connections()
+    key = str(db_path)
+    conn = conns.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key)
+        conn.row_factory = sqlite3.Row
+        for pragma in LOG_DB_PRAGMAS:
+            conn.execute(pragma)
+        conns[key] = conn
+    try:
+        yield conn
+    except BaseException:
+        # Don't leave a half-done write open on the shared connection
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """Fetch all rows as plain dicts, skipping the sqlite3.Row intermediary."""
+    cursor.row_factory = None
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
 class LogDatabase:
     """SQLite database for log storage and querying."""
 
@@ -89,9 +174,19 @@ class LogDatabase:
         self.db_path = db_path
         self._init_db()
 
+    def close(self):
+        """Close this thread's cached connection to the database, if any."""
+        conn = _get_thread_connections().pop(str(self.db_path), None)
+        if conn is not None:
+            conn.close()
+
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
+            # WAL lets readers run alongside a writer; the mode is stored in
+            # the database file, so this is a no-op after the first run
+            conn.execute("PRAGMA journal_mode=WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -110,17 +205,56 @@ class LogDatabase:
                 ON logs(stream_id, timestamp DESC)
             """)
 
+            # Level-filtered queries seek on (stream, level) and read rows
+            # already in timestamp order; this supersedes the old
+            # (stream_id, level) index, which is a prefix of it
+            conn.execute("DROP INDEX IF EXISTS idx_stream_level")
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_stream_level
-                ON logs(stream_id, level)
+                CREATE INDEX IF NOT EXISTS idx_stream_level_time
+                ON logs(stream_id, level, timestamp DESC)
             """)
 
-            # Full-text search
+            # Full-text search (external content index over logs.message)
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'logs_fts'"
+            ).fetchone()
+            if row and "content_rowid" not in row["sql"]:
+                # Pre-trigger definition: never populated, so nothing is lost
+                conn.execute("DROP TABLE logs_fts")
+                row = None
+
             conn.execute("""
                 CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts
-                USING fts5(message, content=logs)
+                USING fts5(
+                    message, content=logs, content_rowid=id,
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3 4'
+                )
+            """)
+
+            # Keep the index in step with logs
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS logs_ai AFTER INSERT ON logs BEGIN
+                    INSERT INTO logs_fts(rowid, message) VALUES (new.id, new.message);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS logs_ad AFTER DELETE ON logs BEGIN
+                    INSERT INTO logs_fts(logs_fts, rowid, message)
+                    VALUES ('delete', old.id, old.message);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS logs_au AFTER UPDATE ON logs BEGIN
+                    INSERT INTO logs_fts(logs_fts, rowid, message)
+                    VALUES ('delete', old.id, old.message);
+                    INSERT INTO logs_fts(rowid, message) VALUES (new.id, new.message);
+                END
             """)
 
+            if row is None:
+                # New (or replaced) index: pick up any rows already in logs
+                conn.execute("INSERT INTO logs_fts(logs_fts) VALUES ('rebuild')")
+
             # Screenshots table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS screenshots (
@@ -187,37 +321,32 @@ class LogDatabase:
 
             conn.commit()
 
-    @contextmanager
     def _get_connection(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get this thread's cached database connection (opened on first use)."""
+        return _cached_connection(self.db_path)
 
     def add_logs(self, stream_id: str, source: str, lines: List[Dict[str, Any]]) -> int:
         """Add log lines to database."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            count = 0
-
-            for line in lines:
-                cursor.execute("""
-                    INSERT INTO logs (stream_id, level, source, message, metadata)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    stream_id,
-                    line.get("level", "INFO"),
-                    source,
-                    line.get("message", ""),
-                    json.dumps(line.get("metadata", {}))
-                ))
-                count += 1
+        rows = [
+            (
+                stream_id,
+                line.get("level", "INFO"),
+                source,
+                line.get("message", ""),
+                # Most lines carry no metadata; skip the encoder for those
+                _json_dumps(line["metadata"]) if line.get("metadata") else "{}"
+            )
+            for line in lines
+        ]
 
+        with self._get_connection() as conn:
+            # One prepared statement and one transaction for the whole batch
+            conn.executemany("""
+                INSERT INTO logs (stream_id, level, source, message, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
             conn.commit()
-            return count
+            return len(rows)
 
     def get_logs(
         self,
@@ -225,12 +354,37 @@ class LogDatabase:
         since: Optional[str] = None,
         level: Optional[str] = None,
         search: Optional[str] = None,
-        limit: int = 1000
+        limit: int = 1000,
+        meta_filter: Optional[Dict[str, Any]] = None
     ) -> List[LogLine]:
-        """Query logs with filters."""
+        """
+        Query logs with filters.
+
+        meta_filter matches top-level metadata keys exactly ({"agent_id": "x"}),
+        evaluated by SQLite's json_extract rather than by decoding rows here.
+        Values compare by JSON type: {"step": 1} matches the number 1, not the
+        string "1" (JSON booleans read back from SQLite as 1/0).
+
+        Raises:
+            ValueError: If a meta_filter key contains a double quote
+        """
         with self._get_connection() as conn:
-            query = "SELECT * FROM logs WHERE stream_id = ?"
-            params = [stream_id]
+            if search:
+                # Use FTS for full-text search: collect matching rowids from the
+                # FTS index first, then look rows up by rowid (CROSS JOIN pins
+                # that order so the planner can't drive from the stream index)
+                query = """
+                    WITH matches AS (
+                        SELECT rowid FROM logs_fts WHERE logs_fts MATCH ?
+                    )
+                    SELECT logs.* FROM matches
+                    CROSS JOIN logs ON logs.rowid = matches.rowid
+                    WHERE stream_id = ?
+                """
+                params = [search, stream_id]
+            else:
+                query = "SELECT * FROM logs WHERE stream_id = ?"
+                params = [stream_id]
 
             if since:
                 query += " AND timestamp >= datetime(?)"
@@ -240,14 +394,12 @@ class LogDatabase:
                 query += " AND level = ?"
                 params.append(level)
 
-            if search:
-                # Use FTS for full-text search
-                query = f"""
-                    SELECT logs.* FROM logs
-                    JOIN logs_fts ON logs.rowid = logs_fts.rowid
-                    WHERE stream_id = ? AND logs_fts MATCH ?
-                """
-                params = [stream_id, search]
+            for key, value in (meta_filter or {}).items():
+                if '"' in key:
+                    raise ValueError(f"Invalid metadata key: {key!r}")
+                # Quoted label, so keys containing '.' or '[' aren't read as paths
+                query += " AND json_extract(metadata, ?) = ?"
+                params.extend([f'$."{key}"', value])
 
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
@@ -263,7 +415,7 @@ class LogDatabase:
                     level=row["level"],
                     source=row["source"],
                     message=row["message"],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+                    metadata=_json_loads(row["metadata"]) if row["metadata"] else {}
                 )
                 for row in rows
             ]
@@ -282,7 +434,7 @@ class LogDatabase:
                 ORDER BY last_log DESC
             """)
 
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
 
     def add_screenshot(
         self,
@@ -295,21 +447,39 @@ class LogDatabase:
         metadata: Dict[str, Any]
     ) -> bool:
         """Add screenshot metadata to database."""
+        self.add_screenshots([{
+            "screenshot_id": screenshot_id,
+            "strand_id": strand_id,
+            "turn_number": turn_number,
+            "label": label,
+            "file_path": file_path,
+            "file_size": file_size,
+            "metadata": metadata,
+        }])
+        return True
+
+    def add_screenshots(self, screenshots: List[Dict[str, Any]]) -> int:
+        """Add metadata for a burst of screenshots in one transaction."""
+        rows = [
+            (
+                shot["screenshot_id"],
+                shot["strand_id"],
+                shot.get("turn_number"),
+                shot["label"],
+                shot["file_path"],
+                shot["file_size"],
+                _json_dumps(shot.get("metadata") or {})
+            )
+            for shot in screenshots
+        ]
+
         with self._get_connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO screenshots (screenshot_id, strand_id, turn_number, label, file_path, file_size, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                screenshot_id,
-                strand_id,
-                turn_number,
-                label,
-                file_path,
-                file_size,
-                json.dumps(metadata)
-            ))
+            """, rows)
             conn.commit()
-            return True
+            return len(rows)
 
     def get_screenshots(
         self,
@@ -334,9 +504,7 @@ class LogDatabase:
             params.append(limit)
 
             cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-
-            return [dict(row) for row in rows]
+            return _fetch_dicts(cursor)
 
     def get_screenshot(self, screenshot_id: str) -> Optional[Dict[str, Any]]:
         """Get specific screenshot by ID."""
@@ -345,8 +513,8 @@ class LogDatabase:
                 "SELECT * FROM screenshots WHERE screenshot_id = ?",
                 (screenshot_id,)
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            rows = _fetch_dicts(cursor)
+            return rows[0] if rows else None
 
     # Sack Operations
 
@@ -387,8 +555,54 @@ class LogDatabase:
         Returns:
             True on success
         """
+        self.add_yields([{
+            "sack_id": sack_id,
+            "chain_id": chain_id,
+            "task_id": task_id,
+            "agent_id": agent_id,
+            "status": status,
+            "outcome": outcome,
+            "artifacts": artifacts,
+            "notes": notes,
+            "duration_seconds": duration_seconds,
+            "tokens_used": tokens_used,
+            "shard_path": shard_path,
+            "tender_id": tender_id,
+            "metadata": metadata,
+        }])
+        return True
+
+    def add_yields(self, yields: List[Dict[str, Any]]) -> int:
+        """
+        Add several yields in one transaction, in list order.
+
+        Each dict takes add_yield's arguments as keys; sack_id, chain_id and
+        task_id are required, the rest default to None.
+
+        Returns:
+            Number of yields added
+        """
+        rows = [
+            (
+                y["sack_id"],
+                y["chain_id"],
+                y["task_id"],
+                y.get("agent_id"),
+                y.get("status"),
+                y.get("outcome"),
+                _json_dumps(y["artifacts"]) if y.get("artifacts") else None,
+                y.get("notes"),
+                y.get("duration_seconds"),
+                y.get("tokens_used"),
+                y.get("shard_path"),
+                y.get("tender_id"),
+                _json_dumps(y["metadata"]) if y.get("metadata") else None
+            )
+            for y in yields
+        ]
+
         with self._get_connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO sacks (
                     sack_id, chain_id, task_id, agent_id,
                     status, outcome, artifacts, notes,
@@ -396,23 +610,9 @@ class LogDatabase:
                     metadata
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                sack_id,
-                chain_id,
-                task_id,
-                agent_id,
-                status,
-                outcome,
-                json.dumps(artifacts) if artifacts else None,
-                notes,
-                duration_seconds,
-                tokens_used,
-                shard_path,
-                tender_id,
-                json.dumps(metadata) if metadata else None
-            ))
+            """, rows)
             conn.commit()
-            return True
+            return len(rows)
 
     def get_chain_yields(self, chain_id: str) -> List[Dict[str, Any]]:
         """
@@ -426,19 +626,16 @@ class LogDatabase:
         """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM sacks WHERE chain_id = ? ORDER BY timestamp",
+                "SELECT * FROM sacks WHERE chain_id = ? ORDER BY timestamp, id",
                 (chain_id,)
             )
-            rows = cursor.fetchall()
-
             results = []
-            for row in rows:
-                yield_dict = dict(row)
+            for yield_dict in _fetch_dicts(cursor):
                 # Parse JSON fields
                 if yield_dict.get('artifacts'):
-                    yield_dict['artifacts'] = json.loads(yield_dict['artifacts'])
+                    yield_dict['artifacts'] = _json_loads(yield_dict['artifacts'])
                 if yield_dict.get('metadata'):
-                    yield_dict['metadata'] = json.loads(yield_dict['metadata'])
+                    yield_dict['metadata'] = _json_loads(yield_dict['metadata'])
                 results.append(yield_dict)
 
             return results
@@ -450,15 +647,15 @@ class LogDatabase:
                 "SELECT * FROM sacks WHERE sack_id = ?",
                 (sack_id,)
             )
-            row = cursor.fetchone()
-            if not row:
+            rows = _fetch_dicts(cursor)
+            if not rows:
                 return None
 
-            yield_dict = dict(row)
+            yield_dict = rows[0]
             if yield_dict.get('artifacts'):
-                yield_dict['artifacts'] = json.loads(yield_dict['artifacts'])
+                yield_dict['artifacts'] = _json_loads(yield_dict['artifacts'])
             if yield_dict.get('metadata'):
-                yield_dict['metadata'] = json.loads(yield_dict['metadata'])
+                yield_dict['metadata'] = _json_loads(yield_dict['metadata'])
             return yield_dict
 
     def get_yields_by_status(self, status: str) -> List[Dict[str, Any]]:
@@ -468,15 +665,12 @@ class LogDatabase:
                 "SELECT * FROM sacks WHERE status = ? ORDER BY timestamp DESC",
                 (status,)
             )
-            rows = cursor.fetchall()
-
             results = []
-            for row in rows:
-                yield_dict = dict(row)
+            for yield_dict in _fetch_dicts(cursor):
                 if yield_dict.get('artifacts'):
-                    yield_dict['artifacts'] = json.loads(yield_dict['artifacts'])
+                    yield_dict['artifacts'] = _json_loads(yield_dict['artifacts'])
                 if yield_dict.get('metadata'):
-                    yield_dict['metadata'] = json.loads(yield_dict['metadata'])
+                    yield_dict['metadata'] = _json_loads(yield_dict['metadata'])
                 results.append(yield_dict)
 
             return results
@@ -488,15 +682,12 @@ class LogDatabase:
                 "SELECT * FROM sacks WHERE agent_id = ? ORDER BY timestamp DESC",
                 (agent_id,)
             )
-            rows = cursor.fetchall()
-
             results = []
-            for row in rows:
-                yield_dict = dict(row)
+            for yield_dict in _fetch_dicts(cursor):
                 if yield_dict.get('artifacts'):
-                    yield_dict['artifacts'] = json.loads(yield_dict['artifacts'])
+                    yield_dict['artifacts'] = _json_loads(yield_dict['artifacts'])
                 if yield_dict.get('metadata'):
-                    yield_dict['metadata'] = json.loads(yield_dict['metadata'])
+                    yield_dict['metadata'] = _json_loads(yield_dict['metadata'])
                 results.append(yield_dict)
 
             return results
@@ -517,10 +708,10 @@ class LogDatabase:
         with self._get_connection() as conn:
             # Get all yields in chain ordered by timestamp
             cursor = conn.execute(
-                "SELECT * FROM sacks WHERE chain_id = ? ORDER BY timestamp",
+                "SELECT * FROM sacks WHERE chain_id = ? ORDER BY timestamp, id",
                 (chain_id,)
             )
-            rows = cursor.fetchall()
+            rows = _fetch_dicts(cursor)
 
             # Find the yield just before the specified task
             previous = None
@@ -532,16 +723,76 @@ class LogDatabase:
             if not previous:
                 return None
 
-            yield_dict = dict(previous)
+            yield_dict = previous
             if yield_dict.get('artifacts'):
-                yield_dict['artifacts'] = json.loads(yield_dict['artifacts'])
+                yield_dict['artifacts'] = _json_loads(yield_dict['artifacts'])
             if yield_dict.get('metadata'):
-                yield_dict['metadata'] = json.loads(yield_dict['metadata'])
+                yield_dict['metadata'] = _json_loads(yield_dict['metadata'])
             return yield_dict
 
 
 # JSON Storage for Structured Artifacts
 
+# Folio locator index: which site holds each folio, so lookups by ID don't
+# scan every site. Only IDs are stored - the file path is derived from the
+# store's sites directory, so the index stays valid if the data directory
+# moves. The JSON files stay the source of truth; a site is re-listed
+# whenever its folios directory's mtime differs from the one recorded at its
+# last listing (or a listed file has gone), which catches files added or
+# removed outside save_folio/move_folio.
+FOLIO_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS folios (
+    folio_id TEXT PRIMARY KEY,
+    site_id TEXT NOT NULL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_folios_site ON folios(site_id);
+
+CREATE TABLE IF NOT EXISTS indexed_sites (
+    site_id TEXT PRIMARY KEY,
+    dir_mtime_ns INTEGER NOT NULL
+);
+"""
+
+# Index databases whose schema has been created by this process
+_folio_index_ready = set()
+
+# Parsed roster per agents.json path: (mtime_ns, size, agents, by_id). Models
+# are handed out as copies, since callers mutate what they get back
+_agents_cache: Dict[str, Tuple[int, int, List[AgentInfo], Dict[str, AgentInfo]]] = {}
+_agents_cache_lock = threading.Lock()
+
+
+def _copy_agent(agent: AgentInfo) -> AgentInfo:
+    """Copy of a cached agent whose mutable fields are safe to modify."""
+    return agent.model_copy(update={
+        "capabilities": list(agent.capabilities),
+        "metadata": dict(agent.metadata),
+    })
+
+
+# Thread directories already moved to the bucketed layout by this process
+_threads_bucketed = set()
+
+
+def _thread_bucket(thread_id: str) -> str:
+    """Two-hex-digit subdirectory (one of 256) a thread's file lives in."""
+    return hashlib.blake2b(thread_id.encode(), digest_size=1).hexdigest()
+
+
+# Files modified more recently than this may change again without their
+# mtime moving, so mtime-validated caches don't trust them yet
+_RACY_MTIME_NS = 2_000_000_000
+
+# Recently read JSON file contents, LRU-bounded and validated against the
+# file's (st_mtime_ns, st_size). Hits are still parsed afresh, so callers can
+# mutate what they get back; the cache saves the open/read. Module-level
+# because JSONStore objects are created per request.
+_JSON_CACHE_SIZE = 1024
+_json_text_cache: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_json_text_cache_lock = threading.Lock()
+
+
 class JSONStore:
     """JSON-based storage for roster, sites, folios, signals."""
 
@@ -555,6 +806,9 @@ class JSONStore:
         self.roster_dir.mkdir(exist_ok=True)
         self.sites_dir.mkdir(exist_ok=True)
         self.threads_dir.mkdir(exist_ok=True)
+        self._bucket_flat_threads()
+
+        self.folio_index_path = base_dir / "folio_index.db"
 
     # Roster Operations
 
@@ -568,6 +822,8 @@ class JSONStore:
         agent_dict = agent.model_dump(mode='json')
 
         if existing_idx is not None:
+            if agents[existing_idx] == agent_dict:
+                return True  # Re-registration with nothing changed
             agents[existing_idx] = agent_dict
         else:
             agents.append(agent_dict)
@@ -575,21 +831,42 @@ class JSONStore:
         self._save_json(agents_file, agents)
         return True
 
-    def get_agents(self, status: Optional[str] = None) -> List[AgentInfo]:
-        """Get registered agents, optionally filtered by status."""
+    def _roster(self) -> Tuple[List[AgentInfo], Dict[str, AgentInfo]]:
+        """Parsed agents.json as (agents, by agent_id), reused while the file is unchanged."""
         agents_file = self.roster_dir / "agents.json"
-        agents_data = self._load_json(agents_file, [])
-        agents = [AgentInfo(**a) for a in agents_data]
+        key = str(agents_file)
+        try:
+            st = os.stat(agents_file)
+        except FileNotFoundError:
+            return [], {}
 
-        if status is not None:
-            agents = [a for a in agents if a.status == status]
+        with _agents_cache_lock:
+            cached = _agents_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
 
-        return agents
+        agents = [AgentInfo(**a) for a in self._load_json(agents_file, [])]
+        by_id: Dict[str, AgentInfo] = {}
+        for agent in agents:
+            by_id.setdefault(agent.agent_id, agent)
+
+        if time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_NS:
+            with _agents_cache_lock:
+                _agents_cache[key] = (st.st_mtime_ns, st.st_size, agents, by_id)
+        return agents, by_id
+
+    def get_agents(self, status: Optional[str] = None) -> List[AgentInfo]:
+        """Get registered agents, optionally filtered by status."""
+        agents, _ = self._roster()
+        return [
+            _copy_agent(a) for a in agents
+            if status is None or a.status == status
+        ]
 
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
         """Get specific agent."""
-        agents = self.get_agents()
-        return next((a for a in agents if a.agent_id == agent_id), None)
+        agent = self._roster()[1].get(agent_id)
+        return _copy_agent(agent) if agent else None
 
     # Site Operations
 
@@ -655,7 +932,8 @@ class JSONStore:
         folios_dir.mkdir(exist_ok=True)
 
         folio_file = folios_dir / f"{folio.folio_id}.json"
-        self._save_json(folio_file, folio.model_dump(mode='json'))
+        self._save_json(folio_file, self._folio_dict(folio))
+        self._index_folio(folio.folio_id, folio.site_id)
         return True
 
     def get_folios(self, site_id: Optional[str] = None) -> List[Folio]:
@@ -663,39 +941,53 @@ class JSONStore:
         folios = []
 
         if site_id:
-            site_dirs = [self.sites_dir / site_id]
+            site_ids = [site_id]
         else:
-            site_dirs = [d for d in self.sites_dir.iterdir() if d.is_dir()]
-
-        for site_dir in site_dirs:
-            folios_dir = site_dir / "folios"
-            if folios_dir.exists():
-                for folio_file in folios_dir.glob("*.json"):
-                    folio_data = self._load_json(folio_file)
-                    # Normalize datetime fields to prevent comparison errors
-                    folio_data = self._normalize_datetime_fields(folio_data)
-                    folios.append(Folio(**folio_data))
+            site_ids = [d.name for d in os.scandir(self.sites_dir) if d.is_dir()]
+
+        loaded = set()
+        stale_sites = []
+        for site_id, folio_file in self._indexed_folio_paths(site_ids):
+            folio_data = self._load_json(folio_file)
+            if not folio_data:
+                # Removed since the site was listed
+                if site_id not in stale_sites:
+                    stale_sites.append(site_id)
+                continue
+            loaded.add(folio_file)
+            # Normalize datetime fields to prevent comparison errors
+            folio_data = self._normalize_datetime_fields(folio_data)
+            folios.append(Folio(**folio_data))
+
+        # Re-list sites whose index named a missing file and pick up what the
+        # fresh listing adds
+        for site_id, folio_file in self._indexed_folio_paths(stale_sites, relist=True):
+            if folio_file in loaded:
+                continue
+            folio_data = self._load_json(folio_file)
+            if folio_data:
+                folio_data = self._normalize_datetime_fields(folio_data)
+                folios.append(Folio(**folio_data))
 
         return folios
 
     def get_folio(self, folio_id: str) -> Optional[Folio]:
         """Get specific folio by ID."""
-        # Search all sites
-        for site_dir in self.sites_dir.iterdir():
-            if site_dir.is_dir():
-                folio_file = site_dir / "folios" / f"{folio_id}.json"
-                if folio_file.exists():
-                    folio_data = self._load_json(folio_file)
-                    folio_data = self._normalize_datetime_fields(folio_data)
-                    folio = Folio(**folio_data)
+        location = self._locate_folio(folio_id)
+        if not location:
+            return None
 
-                    # Lazy hash: compute and save if missing
-                    if not folio.content_hash and KNURL_AVAILABLE:
-                        folio.content_hash = compute_folio_hash(folio)
-                        self._save_json(folio_file, folio.model_dump(mode='json'))
+        folio_file = location[1]
+        folio_data = self._load_json(folio_file)
+        folio_data = self._normalize_datetime_fields(folio_data)
+        folio = Folio(**folio_data)
 
-                    return folio
-        return None
+        # Lazy hash: compute and save if missing
+        if not folio.content_hash and KNURL_AVAILABLE:
+            folio.content_hash = compute_folio_hash(folio)
+            self._save_json(folio_file, self._folio_dict(folio))
+
+        return folio
 
     def move_folio(self, folio_id: str, dest_site_id: str) -> Optional[Folio]:
         """
@@ -705,18 +997,10 @@ class JSONStore:
         Raises ValueError if destination site doesn't exist.
         """
         # Find the folio and its current location
-        source_site_id = None
-        source_file = None
-        for site_dir in self.sites_dir.iterdir():
-            if site_dir.is_dir():
-                folio_file = site_dir / "folios" / f"{folio_id}.json"
-                if folio_file.exists():
-                    source_site_id = site_dir.name
-                    source_file = folio_file
-                    break
-
-        if not source_file or not source_site_id:
+        location = self._locate_folio(folio_id)
+        if not location:
             return None
+        source_site_id, source_file = location
 
         # Verify destination site exists
         dest_site_dir = self.sites_dir / dest_site_id
@@ -741,37 +1025,189 @@ class JSONStore:
 
         # Delete from old location
         source_file.unlink()
+        self._index_folio(folio_id, dest_site_id)
 
         logger.info(f"Moved folio {folio_id} from {old_site_id} to {dest_site_id}")
         return Folio(**folio_data)
 
+    # Folio index
+
+    @contextmanager
+    def _folio_index(self):
+        """Connection to the folio locator index (schema created on first use)."""
+        with _cached_connection(self.folio_index_path) as conn:
+            key = str(self.folio_index_path)
+            if key not in _folio_index_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                columns = {row["name"] for row in conn.execute("PRAGMA table_info(folios)")}
+                if "path" in columns:
+                    # Older index that stored absolute paths; it is only a
+                    # cache, so rebuild it from the files
+                    conn.executescript("DROP TABLE folios; DROP TABLE IF EXISTS indexed_sites;")
+                conn.executescript(FOLIO_INDEX_SCHEMA)
+                _folio_index_ready.add(key)
+            yield conn
+
+    def _folio_file(self, site_id: str, folio_id: str) -> Path:
+        """Path of a folio's file: sites/<site_id>/folios/<folio_id>.json."""
+        return self.sites_dir / site_id / "folios" / f"{folio_id}.json"
+
+    def _index_folio(self, folio_id: str, site_id: str) -> None:
+        """Record which site a folio was just written to."""
+        with self._folio_index() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO folios (folio_id, site_id, updated_at) VALUES (?, ?, ?)",
+                (folio_id, site_id, datetime.now().timestamp())
+            )
+            conn.commit()
+
+    def _indexed_folio_paths(self, site_ids: List[str], relist: bool = False) -> List[Tuple[str, Path]]:
+        """
+        (site_id, path) of the folio files in the given sites, re-listing any
+        site that changed on disk (or every one, with relist).
+        """
+        paths = []
+        with self._folio_index() as conn:
+            for site_id in site_ids:
+                folios_dir = self.sites_dir / site_id / "folios"
+                try:
+                    dir_mtime_ns = folios_dir.stat().st_mtime_ns
+                except FileNotFoundError:
+                    dir_mtime_ns = None
+
+                row = conn.execute(
+                    "SELECT dir_mtime_ns FROM indexed_sites WHERE site_id = ?", (site_id,)
+                ).fetchone()
+                # A directory modified within the last mtime tick or so may
+                # change again without its mtime moving; don't trust it yet
+                racy = dir_mtime_ns is not None and time.time_ns() - dir_mtime_ns < _RACY_MTIME_NS
+                if relist or racy or row is None or row["dir_mtime_ns"] != dir_mtime_ns:
+                    self._relist_site(conn, site_id, folios_dir, dir_mtime_ns)
+
+                paths.extend(
+                    (site_id, self._folio_file(site_id, r["folio_id"])) for r in conn.execute(
+                        "SELECT folio_id FROM folios WHERE site_id = ?", (site_id,)
+                    )
+                )
+            conn.commit()
+        return paths
+
+    def _relist_site(self, conn: sqlite3.Connection, site_id: str, folios_dir: Path,
+                     dir_mtime_ns: Optional[int]) -> None:
+        """Replace a site's index rows with the folio files currently on disk."""
+        conn.execute("DELETE FROM folios WHERE site_id = ?", (site_id,))
+        if dir_mtime_ns is None:
+            conn.execute("DELETE FROM indexed_sites WHERE site_id = ?", (site_id,))
+            return
+
+        with os.scandir(folios_dir) as entries:
+            rows = [
+                (entry.name[:-len(".json")], site_id, entry.stat().st_mtime)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        conn.executemany(
+            "INSERT OR REPLACE INTO folios (folio_id, site_id, updated_at) VALUES (?, ?, ?)",
+            rows
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO indexed_sites (site_id, dir_mtime_ns) VALUES (?, ?)",
+            (site_id, dir_mtime_ns)
+        )
+
+    def _locate_folio(self, folio_id: str) -> Optional[Tuple[str, Path]]:
+        """(site_id, path) of a folio: index lookup first, full site scan on a miss."""
+        with self._folio_index() as conn:
+            row = conn.execute(
+                "SELECT site_id FROM folios WHERE folio_id = ?", (folio_id,)
+            ).fetchone()
+        if row:
+            folio_file = self._folio_file(row["site_id"], folio_id)
+            if folio_file.exists():
+                return row["site_id"], folio_file
+
+        # Not indexed (or moved outside the store) - search all sites
+        for site_dir in self.sites_dir.iterdir():
+            if site_dir.is_dir():
+                folio_file = site_dir / "folios" / f"{folio_id}.json"
+                if folio_file.exists():
+                    self._index_folio(folio_id, site_dir.name)
+                    return site_dir.name, folio_file
+        return None
+
     # Thread Operations
 
+    def _thread_file(self, thread_id: str) -> Path:
+        """Path of a thread's file: threads/<bucket>/<thread_id>.json."""
+        return self.threads_dir / _thread_bucket(thread_id) / f"{thread_id}.json"
+
+    def _iter_thread_files(self):
+        """Yield every thread file across all buckets."""
+        with os.scandir(self.threads_dir) as buckets:
+            bucket_paths = [b.path for b in buckets if b.is_dir()]
+        for bucket_path in bucket_paths:
+            with os.scandir(bucket_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        yield Path(entry.path)
+
+    def _bucket_flat_threads(self) -> None:
+        """Move thread files from the old flat threads/ layout into buckets."""
+        key = str(self.threads_dir)
+        if key in _threads_bucketed:
+            return
+        with os.scandir(self.threads_dir) as entries:
+            flat = [e.name for e in entries if e.name.endswith(".json") and e.is_file()]
+        for name in flat:
+            target = self._thread_file(name[:-len(".json")])
+            target.parent.mkdir(exist_ok=True)
+            try:
+                os.replace(self.threads_dir / name, target)
+            except FileNotFoundError:
+                pass  # Another process moved it first
+        _threads_bucketed.add(key)
+
     def save_thread(self, thread: Thread) -> bool:
         """Save thread."""
-        thread_file = self.threads_dir / f"{thread.thread_id}.json"
+        thread_file = self._thread_file(thread.thread_id)
+        thread_file.parent.mkdir(exist_ok=True)
         self._save_json(thread_file, thread.model_dump(mode='json'))
         return True
 
-    def get_threads(self, from_id: Optional[str] = None, to_id: Optional[str] = None, type: Optional[str] = None, weaver: Optional[str] = None) -> List[Thread]:
-        """Get threads with optional filters."""
-        threads = []
-        for thread_file in self.threads_dir.glob("*.json"):
-            thread_data = self._load_json(thread_file)
-            thread = Thread(**thread_data)
+    def _iter_thread_data(self):
+        """Yield (path, raw dict) for every thread file, without building models."""
+        for thread_file in self._iter_thread_files():
+            yield thread_file, self._load_json(thread_file)
 
-            # Apply filters
-            if from_id and thread.from_id != from_id:
+    def get_threads(self, from_id: Optional[str] = None, to_id: Optional[str] = None, type: Optional[str] = None, weaver: Optional[str] = None,
+                    types: Optional[List[str]] = None) -> List[Thread]:
+        """Get threads with optional filters (types matches any of several types)."""
+        threads = []
+        for _, thread_data in self._iter_thread_data():
+            # Apply filters on the raw fields; only matches get validated
+            if from_id and thread_data.get("from_id") != from_id:
                 continue
-            if to_id and thread.to_id != to_id:
+            if to_id and thread_data.get("to_id") != to_id:
                 continue
-            if type and thread.type != type:
+            if type and thread_data.get("type") != type:
                 continue
-            if weaver and thread.weaver != weaver:
+            if types is not None and thread_data.get("type") not in types:
                 continue
+            if weaver and thread_data.get("weaver") != weaver:
+                continue
+
+            threads.append(Thread(**thread_data))
 
-            threads.append(thread)
+        return threads
 
+    def get_threads_touching(self, resource_id: str) -> List[Thread]:
+        """Get threads from or to a resource in one pass, oldest first."""
+        threads = [
+            Thread(**thread_data)
+            for _, thread_data in self._iter_thread_data()
+            if thread_data.get("from_id") == resource_id or thread_data.get("to_id") == resource_id
+        ]
+        threads.sort(key=lambda t: t.created_at)
         return threads
 
     def get_inbox(self, agent_id: str, unread_only: bool = False) -> List[Thread]:
@@ -783,45 +1219,44 @@ class JSONStore:
         2. Threads WOVEN BY agent (weaver=agent_id)
         3. Replies to threads agent is involved in (recursive)
         """
-        # Start with threads TO agent (direct messages)
-        direct_threads = self.get_threads(to_id=agent_id)
-
-        # Add threads WOVEN BY agent (threads they created)
-        woven_threads = self.get_threads(weaver=agent_id)
-
-        # Combine and deduplicate
-        thread_map = {}
-        for t in direct_threads + woven_threads:
-            thread_map[t.thread_id] = t
+        # Walk the reply graph over raw thread dicts; only threads that end
+        # up in the inbox are validated into models
+        all_threads = {}
+        for _, data in self._iter_thread_data():
+            all_threads[data["thread_id"]] = data
 
-        # Find replies to any threads in the inbox
         # A reply can have either:
         #   - from_id = thread_id (thread chaining: thread-A -> thread-B)
         #   - to_id = thread_id (agent reply: agent -> thread-A via 'skein reply')
-        all_threads = self.get_threads()
-        involved_thread_ids = set(thread_map.keys())
-
-        # Keep adding reply layers until we find no more
-        # Limit depth to prevent performance issues
-        max_depth = 5
-        for _ in range(max_depth):
-            found_new = False
-            for thread in all_threads:
-                if thread.thread_id in thread_map:
-                    continue
-                # Include if from_id or to_id is a thread we care about
-                if thread.from_id in involved_thread_ids or thread.to_id in involved_thread_ids:
-                    thread_map[thread.thread_id] = thread
-                    involved_thread_ids.add(thread.thread_id)
-                    found_new = True
-
-            if not found_new:
-                break
-
-        threads = list(thread_map.values())
-
-        if unread_only:
-            threads = [t for t in threads if t.read_at is None]
+        replies_to: Dict[str, List[str]] = {}
+        for thread_id, data in all_threads.items():
+            replies_to.setdefault(data["from_id"], []).append(thread_id)
+            if data["to_id"] != data["from_id"]:
+                replies_to.setdefault(data["to_id"], []).append(thread_id)
+
+        # Start with threads TO agent (direct messages) and threads WOVEN BY
+        # agent (threads they created)
+        seen = dict.fromkeys(
+            thread_id for thread_id, data in all_threads.items()
+            if data["to_id"] == agent_id or data.get("weaver") == agent_id
+        )
+
+        # Follow replies breadth-first; seen keeps discovery order and each
+        # thread is expanded at most once
+        frontier = list(seen)
+        while frontier:
+            next_frontier = []
+            for thread_id in frontier:
+                for reply_id in replies_to.get(thread_id, ()):
+                    if reply_id not in seen:
+                        seen[reply_id] = None
+                        next_frontier.append(reply_id)
+            frontier = next_frontier
+
+        threads = [
+            Thread(**all_threads[t]) for t in seen
+            if not unread_only or all_threads[t].get("read_at") is None
+        ]
 
         # Sort by created_at, most recent first
         threads.sort(key=lambda t: t.created_at, reverse=True)
@@ -830,7 +1265,7 @@ class JSONStore:
 
     def mark_thread_read(self, thread_id: str) -> bool:
         """Mark thread as read."""
-        thread_file = self.threads_dir / f"{thread_id}.json"
+        thread_file = self._thread_file(thread_id)
         if not thread_file.exists():
             return False
 
@@ -841,6 +1276,10 @@ class JSONStore:
 
     # Helper methods
 
+    def _folio_dict(self, folio: Folio) -> Dict[str, Any]:
+        """Folio as stored on disk, with timestamps already in canonical form."""
+        return self._normalize_datetime_fields(folio.model_dump(mode='json'))
+
     def _normalize_datetime_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize datetime fields to be timezone-aware.
@@ -849,6 +1288,9 @@ class JSONStore:
         timezone-aware, others as naive. This causes comparison errors.
 
         Convert all datetime strings to timezone-aware (UTC) format.
+
+        Folios are written in this form, so on load most values take the
+        already-canonical fast path; only legacy files need parsing.
         """
         datetime_fields = ['created_at', 'registered_at', 'acknowledged_at', 'read_at']
 
@@ -859,6 +1301,10 @@ class JSONStore:
                 if isinstance(dt_str, datetime):
                     continue
 
+                # Already ISO with a +HH:MM/-HH:MM offset (what we write)
+                if len(dt_str) > 6 and dt_str[-6] in '+-' and dt_str[-3] == ':':
+                    continue
+
                 # Parse the datetime string
                 try:
                     # Try parsing with timezone first
@@ -880,16 +1326,57 @@ class JSONStore:
 
     def _load_json(self, file_path: Path, default=None):
         """Load JSON file."""
-        if not file_path.exists():
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return default if default is not None else {}
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        key = str(file_path)
+        text = None
+        with _json_text_cache_lock:
+            cached = _json_text_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                _json_text_cache.move_to_end(key)
+                text = cached[2]
+
+        if text is None:
+            with open(file_path, 'rb') as f:
+                text = f.read()
+            if time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_NS:
+                with _json_text_cache_lock:
+                    _json_text_cache[key] = (st.st_mtime_ns, st.st_size, text)
+                    _json_text_cache.move_to_end(key)
+                    if len(_json_text_cache) > _JSON_CACHE_SIZE:
+                        _json_text_cache.popitem(last=False)
+
+        return _json_loads(text)
 
     def _save_json(self, file_path: Path, data):
-        """Save JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        """Save JSON file atomically, leaving it untouched if nothing changed."""
+        payload = _json_dumps_pretty(data)
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read() == payload:
+                    return
+        except FileNotFoundError:
+            pass
+
+        with _json_text_cache_lock:
+            _json_text_cache.pop(str(file_path), None)
+
+        # Write beside the target and rename over it, so readers (and a crash
+        # mid-write) never see a truncated file. The suffix keeps the temp
+        # file out of *.json listings; pid/thread keep concurrent writers apart.
+        tmp_path = file_path.with_name(
+            f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
 
 # Legacy module-level instances removed - use Depends(get_project_log_db) and Depends(get_project_store) in routes.py
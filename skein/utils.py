@@ -2,25 +2,67 @@
 SKEIN utility functions.
 """
 
-import random
+import importlib.util
+import secrets
 import string
 import re
 import subprocess
 import json
-from datetime import datetime
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Set, Optional, Dict, Any, Callable
+from typing import List, Set, FrozenSet, Optional, Dict, Any, Callable, Iterable, Tuple
 from functools import lru_cache
 
+from .words import get_word_name
+
+
+# @mentions: word-word-... of alphanumerics and hyphens, case-insensitive.
+# The pattern itself requires a hyphen, so bare @words never reach Python.
+# '@' is outside the character class, so each attempt backtracks at most over
+# its own run and matching stays linear in the content length
+_MENTION_RE = re.compile(r'@([a-z0-9][a-z0-9-]*-[a-z0-9-]*)', re.IGNORECASE)
+
+# Relative times like '1day', '2hours', '30min'
+_REL_TIME_RE = re.compile(r'^(\d+)(day|hour|min|minute)s?$')
+
+
+# Random ID suffixes draw from lowercase letters and digits
+_ID_ALPHABET = string.ascii_lowercase + string.digits
+
+# (epoch second, YYYYMMDD) of the last ID generated; strftime only reruns
+# when the second changes
+_date_cache = (0, "")
+
+
+def _today() -> str:
+    """Local date as YYYYMMDD, recomputed at most once per second."""
+    global _date_cache
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, datetime.fromtimestamp(now).strftime("%Y%m%d"))
+    return _date_cache[1]
+
+
+def _random_suffix(alphabet: str = _ID_ALPHABET, k: int = 4) -> str:
+    """k cryptographically random characters from alphabet."""
+    return ''.join(secrets.choice(alphabet) for _ in range(k))
+
+
+def _generate_id(prefix: str) -> str:
+    """Build {prefix}-{YYYYMMDD}-{4char} with a cryptographically random suffix."""
+    return f"{prefix}-{_today()}-{_random_suffix()}"
+
 
 def generate_folio_id(folio_type: str) -> str:
     """
     Generate folio ID with format: {type}-{YYYYMMDD}-{4char}
     Example: issue-20251106-a7b3
     """
-    date_str = datetime.now().strftime("%Y%m%d")
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"{folio_type}-{date_str}-{random_suffix}"
+    return _generate_id(folio_type)
 
 
 def generate_thread_id() -> str:
@@ -28,9 +70,7 @@ def generate_thread_id() -> str:
     Generate thread ID with format: thread-{YYYYMMDD}-{4char}
     Example: thread-20251107-p8q2
     """
-    date_str = datetime.now().strftime("%Y%m%d")
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"thread-{date_str}-{random_suffix}"
+    return _generate_id("thread")
 
 
 def generate_yield_id() -> str:
@@ -38,12 +78,11 @@ def generate_yield_id() -> str:
     Generate yield/sack ID with format: sack-{YYYYMMDD}-{4char}
     Example: sack-20251210-x7m2
     """
-    date_str = datetime.now().strftime("%Y%m%d")
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"sack-{date_str}-{random_suffix}"
+    return _generate_id("sack")
 
 
-def parse_mentions(content: str) -> Set[str]:
+@lru_cache(maxsize=4096)
+def parse_mentions(content: str) -> FrozenSet[str]:
     """
     Parse @mentions from content.
 
@@ -57,29 +96,172 @@ def parse_mentions(content: str) -> Set[str]:
     - @summary-123 (summary mentions)
     - @friction-456 (friction mentions)
 
+    Results are cached, so the returned set is immutable.
+
     Returns:
-        Set of unique resource IDs mentioned
+        Frozenset of unique resource IDs mentioned (lowercased)
     """
     if not content:
-        return set()
+        return frozenset()
 
-    # Pattern matches @word-word-... allowing alphanumeric and hyphens
-    # Case-insensitive matching
-    pattern = r'@([a-z0-9][a-z0-9\-]+)'
-    matches = re.findall(pattern, content.lower())
+    return frozenset(match.lower() for match in _MENTION_RE.findall(content))
 
-    # Filter to valid resource ID patterns (must have at least one hyphen)
-    valid_mentions = set()
-    for match in matches:
-        if '-' in match:
-            valid_mentions.add(match)
 
-    return valid_mentions
+# Pure Threads: In-memory cache for status/assignment lookups
 
+class _TTLCache:
+    """
+    Size-bounded mapping whose entries expire ``ttl`` seconds after insertion.
 
-# Pure Threads: In-memory cache for status/assignment lookups
-_status_cache: Dict[str, Optional[str]] = {}
-_assignment_cache: Dict[str, Optional[str]] = {}
+    Least recently used entries are evicted once ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_MISSING = object()
+
+# folio_id -> (store data dir, value). One server process serves several
+# projects, so an entry only counts as a hit for the store that produced it
+_status_cache = _TTLCache(maxsize=10000, ttl=60)
+_assignment_cache = _TTLCache(maxsize=10000, ttl=60)
+
+
+# thread type -> (cache, folio the thread describes, value it carries)
+_FOLIO_THREAD_KINDS: Dict[str, Tuple[_TTLCache, Callable[[Any], str], Callable[[Any], Optional[str]]]] = {
+    "status": (_status_cache, lambda t: t.to_id, lambda t: t.content),
+    "assignment": (_assignment_cache, lambda t: t.from_id, lambda t: t.to_id),
+}
+
+
+def _latest_per_folio(
+    folio_ids: Iterable[str],
+    json_store,
+    kinds: Tuple[str, ...],
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Resolve the newest thread value of each kind for each folio.
+
+    Cache misses for every requested kind are filled from a single pass over
+    the matching threads.
+    """
+    folio_ids = list(folio_ids)
+    store_key = str(getattr(json_store, "base_dir", id(json_store)))
+    result: Dict[str, Dict[str, Optional[str]]] = {kind: {} for kind in kinds}
+    missing: Dict[str, Set[str]] = {}
+    for kind in kinds:
+        cache = _FOLIO_THREAD_KINDS[kind][0]
+        for folio_id in folio_ids:
+            cached = cache.get(folio_id, _MISSING)
+            if cached is _MISSING or cached[0] != store_key:
+                missing.setdefault(kind, set()).add(folio_id)
+            else:
+                result[kind][folio_id] = cached[1]
+
+    if missing:
+        latest: Dict[str, Dict[str, Any]] = {kind: {} for kind in missing}
+        for thread in json_store.get_threads(types=list(missing)):
+            key = _FOLIO_THREAD_KINDS[thread.type][1](thread)
+            if key in missing[thread.type]:
+                newest = latest[thread.type]
+                current = newest.get(key)
+                if current is None or thread.created_at > current.created_at:
+                    newest[key] = thread
+        for kind, folio_id_set in missing.items():
+            cache, _, value = _FOLIO_THREAD_KINDS[kind]
+            for folio_id in folio_id_set:
+                thread = latest[kind].get(folio_id)
+                result[kind][folio_id] = value(thread) if thread is not None else None
+                cache[folio_id] = (store_key, result[kind][folio_id])
+
+    return result
+
+
+def get_status_map(
+    folio_ids: Iterable[str], json_store
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Get current status and assignment for many folios with one thread scan.
+
+    Args:
+        folio_ids: Folio IDs to resolve
+        json_store: JSONStore instance to query threads
+
+    Returns:
+        Dict mapping each folio ID to (status, assigned agent ID); either is
+        None if the folio has no threads of that type
+    """
+    folio_ids = list(folio_ids)
+    resolved = _latest_per_folio(folio_ids, json_store, ("status", "assignment"))
+    return {
+        folio_id: (resolved["status"][folio_id], resolved["assignment"][folio_id])
+        for folio_id in folio_ids
+    }
+
+
+def get_current_statuses(folio_ids: Iterable[str], json_store) -> Dict[str, Optional[str]]:
+    """
+    Get current status for many folios at once.
+
+    Threads are scanned once for all uncached folios rather than once per folio.
+
+    Args:
+        folio_ids: Folio IDs to get status for
+        json_store: JSONStore instance to query threads
+
+    Returns:
+        Dict mapping each folio ID to its status string, or None if it has no
+        status threads
+    """
+    return _latest_per_folio(folio_ids, json_store, ("status",))["status"]
+
+
+def get_current_assignments(folio_ids: Iterable[str], json_store) -> Dict[str, Optional[str]]:
+    """
+    Get current assignment for many folios at once.
+
+    Threads are scanned once for all uncached folios rather than once per folio.
+
+    Args:
+        folio_ids: Folio IDs to get assignment for
+        json_store: JSONStore instance to query threads
+
+    Returns:
+        Dict mapping each folio ID to its assigned agent ID, or None if it has
+        no assignment threads
+    """
+    return _latest_per_folio(folio_ids, json_store, ("assignment",))["assignment"]
 
 
 def get_current_status(folio_id: str, json_store) -> Optional[str]:
@@ -96,24 +278,7 @@ def get_current_status(folio_id: str, json_store) -> Optional[str]:
     Returns:
         Status string or None if no status threads found
     """
-    # Check cache first
-    if folio_id in _status_cache:
-        return _status_cache[folio_id]
-
-    # Get all status threads pointing to this folio
-    status_threads = json_store.get_threads(to_id=folio_id, type="status")
-
-    if not status_threads:
-        _status_cache[folio_id] = None
-        return None
-
-    # Get the most recent status thread
-    status_threads.sort(key=lambda t: t.created_at, reverse=True)
-    latest_status = status_threads[0].content
-
-    # Cache and return
-    _status_cache[folio_id] = latest_status
-    return latest_status
+    return get_current_statuses([folio_id], json_store)[folio_id]
 
 
 def get_current_assignment(folio_id: str, json_store) -> Optional[str]:
@@ -130,36 +295,17 @@ def get_current_assignment(folio_id: str, json_store) -> Optional[str]:
     Returns:
         Agent ID or None if no assignment threads found
     """
-    # Check cache first
-    if folio_id in _assignment_cache:
-        return _assignment_cache[folio_id]
-
-    # Get all assignment threads originating from this folio
-    assignment_threads = json_store.get_threads(from_id=folio_id, type="assignment")
-
-    if not assignment_threads:
-        _assignment_cache[folio_id] = None
-        return None
-
-    # Get the most recent assignment thread
-    assignment_threads.sort(key=lambda t: t.created_at, reverse=True)
-    latest_assignment = assignment_threads[0].to_id
-
-    # Cache and return
-    _assignment_cache[folio_id] = latest_assignment
-    return latest_assignment
+    return get_current_assignments([folio_id], json_store)[folio_id]
 
 
 def invalidate_status_cache(folio_id: str):
     """Invalidate status cache for a folio when a new status thread is created."""
-    if folio_id in _status_cache:
-        del _status_cache[folio_id]
+    _status_cache.pop(folio_id)
 
 
 def invalidate_assignment_cache(folio_id: str):
     """Invalidate assignment cache for a folio when a new assignment thread is created."""
-    if folio_id in _assignment_cache:
-        del _assignment_cache[folio_id]
+    _assignment_cache.pop(folio_id)
 
 
 def auto_invalidate_cache(thread_type: str, folio_id: str):
@@ -198,8 +344,6 @@ def format_relative_time(dt: datetime) -> str:
     Returns:
         Human-readable relative time string
     """
-    from datetime import timezone
-
     now = datetime.now(timezone.utc)
 
     # Make dt timezone-aware if needed (assume UTC for naive)
@@ -243,8 +387,6 @@ def parse_relative_time(time_str: str) -> datetime:
     Raises:
         ValueError: If time string format is invalid
     """
-    from datetime import timedelta, timezone
-
     time_str = time_str.strip().lower()
 
     # Try ISO format first
@@ -258,7 +400,7 @@ def parse_relative_time(time_str: str) -> datetime:
         pass
 
     # Parse relative time
-    match = re.match(r'^(\d+)(day|hour|min|minute)s?$', time_str)
+    match = _REL_TIME_RE.match(time_str)
     if not match:
         raise ValueError(f"Invalid time format: '{time_str}'. Use '1day', '2hours', '30min', or ISO format")
 
@@ -300,8 +442,9 @@ def generate_agent_name(
     Config format:
         {
             "naming": {
-                "generator": null           // Use default
+                "generator": null,          // Use default
                 // or: "~/.skein/namer.py"  // Custom script
+                "in_process": false         // Opt in to in-process .py plugins
             }
         }
 
@@ -310,6 +453,11 @@ def generate_agent_name(
     - Outputs name on stdout
     - Exit 0 = use name, non-zero = fall back to default
 
+    With "in_process": true, a .py generator that defines a top-level
+    generate(context: dict) -> str is imported and called in-process instead
+    (same context dict; an empty result or an exception falls back to the
+    default). The plugin then runs without the subprocess timeout or isolation.
+
     Args:
         existing_names: Set of names to avoid (for collision handling)
         project: Project context (passed to custom generator)
@@ -323,10 +471,10 @@ def generate_agent_name(
     existing = existing_names or set()
 
     # Try to load custom generator from config
-    custom_generator = _load_custom_generator(config_path)
+    custom_generator, in_process = _load_custom_generator(config_path)
 
     if custom_generator:
-        name = _run_custom_generator(custom_generator, project, role, brief_content)
+        name = _run_custom_generator(custom_generator, project, role, brief_content, in_process)
         if name:
             # Check for collision and handle
             return _ensure_unique(name, existing)
@@ -335,7 +483,7 @@ def generate_agent_name(
     return _generate_default_name(existing)
 
 
-def _load_custom_generator(config_path: Optional[Path] = None) -> Optional[str]:
+def _load_custom_generator(config_path: Optional[Path] = None) -> Tuple[Optional[str], bool]:
     """
     Load custom generator path from config.
 
@@ -345,7 +493,8 @@ def _load_custom_generator(config_path: Optional[Path] = None) -> Optional[str]:
     3. ~/.skein/config.json (user global)
 
     Returns:
-        Path to custom generator script, or None for default
+        (path to custom generator script or None for default,
+         whether the naming config opts in to in-process loading)
     """
     config_locations = []
 
@@ -353,27 +502,47 @@ def _load_custom_generator(config_path: Optional[Path] = None) -> Optional[str]:
         config_locations.append(config_path)
 
     # Project-local config
-    project_config = Path.cwd() / ".skein" / "config.json"
-    if project_config.exists():
+    project_config = os.path.join(os.getcwd(), ".skein", "config.json")
+    if os.path.isfile(project_config):
         config_locations.append(project_config)
 
     # User global config
-    global_config = Path.home() / ".skein" / "config.json"
-    if global_config.exists():
+    global_config = os.path.join(os.path.expanduser("~"), ".skein", "config.json")
+    if os.path.isfile(global_config):
         config_locations.append(global_config)
 
     for config_file in config_locations:
         try:
             with open(config_file) as f:
                 config = json.load(f)
-                generator = config.get("naming", {}).get("generator")
+                naming = config.get("naming", {})
+                generator = naming.get("generator")
                 if generator:
                     # Expand ~ to home directory
-                    return str(Path(generator).expanduser())
+                    return str(Path(generator).expanduser()), naming.get("in_process") is True
         except (json.JSONDecodeError, IOError):
             continue
 
-    return None
+    return None, False
+
+
+@lru_cache(maxsize=32)
+def _load_generator_plugin(generator_path: str, mtime_ns: int) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """
+    Import a Python generator's generate() entry point, if it has one.
+
+    Only called when the naming config sets "in_process": true. Keyed on mtime
+    so edits to the script are picked up.
+    """
+    spec = importlib.util.spec_from_file_location(f"_skein_namer_{mtime_ns}", generator_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return getattr(module, "generate", None)
 
 
 def _run_custom_generator(
@@ -381,6 +550,7 @@ def _run_custom_generator(
     project: Optional[str] = None,
     role: Optional[str] = None,
     brief_content: Optional[str] = None,
+    in_process: bool = False,
 ) -> Optional[str]:
     """
     Run custom generator script.
@@ -390,20 +560,37 @@ def _run_custom_generator(
     - Outputs name on stdout (stripped)
     - Exit 0 = use name, non-zero = fall back to default
 
+    With in_process, Python generators exposing generate(context) are called
+    in-process, avoiding an interpreter start per name. Everything else runs
+    as a subprocess with a 5s timeout.
+
     Returns:
         Generated name, or None if generator fails
     """
-    try:
-        input_data = json.dumps({
-            "project": project or "",
-            "role": role or "",
-            "timestamp": datetime.now().isoformat(),
-            "brief_content": brief_content or "",
-        })
+    context = {
+        "project": project or "",
+        "role": role or "",
+        "timestamp": datetime.now().isoformat(),
+        "brief_content": brief_content or "",
+    }
+
+    if in_process and generator_path.endswith(".py"):
+        try:
+            plugin = _load_generator_plugin(generator_path, os.stat(generator_path).st_mtime_ns)
+        except OSError:
+            plugin = None
+        if plugin is not None:
+            try:
+                name = plugin(context)
+            except Exception:
+                return None
+            name = str(name).strip() if name else ""
+            return name or None
 
+    try:
         result = subprocess.run(
             [generator_path],
-            input=input_data,
+            input=json.dumps(context),
             capture_output=True,
             text=True,
             timeout=5,
@@ -426,15 +613,12 @@ def _generate_default_name(existing: Set[str]) -> str:
 
     Handles collisions by appending incrementing suffix.
     """
-    from .words import get_word_pair
-
     now = datetime.now()
     time_suffix = now.strftime("%m%d")
 
     # Try up to 10 times to find unique name
     for attempt in range(10):
-        adj, noun = get_word_pair()
-        base_name = f"{adj}-{noun}-{time_suffix}"
+        base_name = get_word_name() + "-" + time_suffix
 
         if attempt == 0:
             name = base_name
@@ -445,17 +629,19 @@ def _generate_default_name(existing: Set[str]) -> str:
             return name
 
     # Fallback: add random suffix
-    random_suffix = ''.join(random.choices(string.ascii_lowercase, k=4))
-    return f"{adj}-{noun}-{time_suffix}-{random_suffix}"
+    random_suffix = _random_suffix(string.ascii_lowercase)
+    return f"{base_name}-{random_suffix}"
 
 
-def _ensure_unique(name: str, existing: Set[str]) -> str:
+def _ensure_unique(name: str, existing: Set[str], next_suffix: Optional[Dict[str, int]] = None) -> str:
     """
     Ensure name is unique by appending suffix if needed.
 
     Args:
         name: Base name to check
         existing: Set of existing names to avoid
+        next_suffix: Per-name suffix to resume from, updated in place; only
+            valid while existing only grows (e.g. across one bulk creation)
 
     Returns:
         Unique name (original or with suffix)
@@ -463,12 +649,15 @@ def _ensure_unique(name: str, existing: Set[str]) -> str:
     if name not in existing:
         return name
 
-    # Try incrementing suffix
-    for i in range(1, 100):
+    # Try incrementing suffix, resuming after the last one handed out
+    start = next_suffix.get(name, 1) if next_suffix is not None else 1
+    for i in range(start, 100):
         candidate = f"{name}-{i}"
         if candidate not in existing:
+            if next_suffix is not None:
+                next_suffix[name] = i + 1
             return candidate
 
     # Fallback: random suffix
-    random_suffix = ''.join(random.choices(string.ascii_lowercase, k=4))
+    random_suffix = _random_suffix(string.ascii_lowercase)
     return f"{name}-{random_suffix}"
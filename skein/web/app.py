@@ -2,53 +2,114 @@
 SKEIN Web Application - Server-rendered HTMX interface.
 """
 
+import asyncio
+import heapq
+import json
 import logging
 import os
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import uvicorn
 from fastapi import FastAPI, Request, Depends, Query, HTTPException
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 import re
 
 from ..storage import JSONStore, LogDatabase, get_data_dir_for_project
-from ..utils import get_current_status, get_current_assignment
+from ..models import Folio
+from ..utils import get_current_statuses, get_status_map
 
 logger = logging.getLogger(__name__)
 
+# Markdown header prefix, then leading bold markers, stripped from titles
+_TITLE_PREFIX_RE = re.compile(r'(?:#+\s*)?(?:\*\*|__)?')
+
+# Folio IDs like brief-20251208-0jt9, issue-20251207-akrj, etc. Fixed-width
+# after the literal prefix, so each position is rejected in bounded steps
+_FOLIO_ID_RE = re.compile(
+    r'\b(?:brief|issue|friction|finding|notion|summary|tender|plan|playbook|mantle|writ)-\d{8}-[a-z0-9]{4}\b',
+    re.IGNORECASE
+)
+
 
 def clean_title(title: str, fallback: str = "") -> str:
     """Clean up a folio title for display."""
     if not title:
         return fallback
-    # Strip markdown headers
-    title = re.sub(r'^#+\s*', '', title)
-    # Strip leading ** or __
-    title = re.sub(r'^\*\*|^__', '', title)
+    # Strip a markdown header and leading ** or __; most titles start with
+    # neither, so only run the regex when the first character could match
+    if title[0] in '#*_':
+        title = title[_TITLE_PREFIX_RE.match(title).end():]
     # Truncate
     if len(title) > 80:
         title = title[:77] + "..."
     return title or fallback
 
+
+# Status and assignee as derived from status/assignment threads
+FolioMeta = namedtuple("FolioMeta", ["status", "assigned_to"])
+
+
+def _folio_meta(folios: Iterable[Folio], store: JSONStore) -> Dict[str, FolioMeta]:
+    """Compute each folio's current status and assignee without touching the folio."""
+    folios = list(folios)
+    status_map = get_status_map([f.folio_id for f in folios], store)
+    meta = {}
+    for f in folios:
+        computed_status, computed_assignment = status_map[f.folio_id]
+        meta[f.folio_id] = FolioMeta(
+            computed_status or f.status or "open",
+            computed_assignment or f.assigned_to,
+        )
+    return meta
+
+
+async def _fetch(*calls: Callable[[], Any]) -> List[Any]:
+    """Run independent blocking store reads concurrently in the threadpool."""
+    return await asyncio.gather(*(run_in_threadpool(call) for call in calls))
+
+
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 STATIC_DIR = Path(__file__).parent / "static"
 
 
+def _template_env() -> Environment:
+    """Build the Jinja environment with a bytecode cache and every template preloaded.
+
+    Compiled templates are kept in Jinja's per-user temp cache directory, so a
+    restart loads bytecode instead of re-parsing sources. Loading them all up
+    front keeps the first request to each page off the compile path.
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        bytecode_cache=FileSystemBytecodeCache(),
+        autoescape=True,
+    )
+    # Filters are resolved at compile time, so register them before preloading
+    env.filters['clean_title'] = clean_title
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
+    return env
+
+
+@lru_cache(maxsize=1)
 def get_project_id() -> str:
-    """Get project ID from environment."""
+    """Get project ID from environment (resolved once per server process)."""
     project_id = os.environ.get("SKEIN_PROJECT")
     if not project_id:
-        # Try to find from .skein/config.json
-        import json
-        cwd = Path.cwd()
-        while cwd != cwd.parent:
-            config_file = cwd / ".skein" / "config.json"
-            if config_file.exists():
+        # Try to find from .skein/config.json in cwd or an ancestor
+        cwd = os.getcwd()
+        while cwd != os.path.dirname(cwd):
+            config_file = os.path.join(cwd, ".skein", "config.json")
+            if os.path.isfile(config_file):
                 try:
                     with open(config_file) as f:
                         config = json.load(f)
@@ -57,23 +118,28 @@ def get_project_id() -> str:
                             break
                 except:
                     pass
-            cwd = cwd.parent
+            cwd = os.path.dirname(cwd)
     return project_id or "default"
 
 
+@lru_cache(maxsize=None)
+def _store_for(project_id: str) -> JSONStore:
+    return JSONStore(get_data_dir_for_project(project_id))
+
+
+@lru_cache(maxsize=None)
+def _log_db_for(project_id: str) -> LogDatabase:
+    return LogDatabase(get_data_dir_for_project(project_id) / "skein.db")
+
+
 def get_store() -> JSONStore:
-    """Get JSONStore for current project."""
-    project_id = get_project_id()
-    data_dir = get_data_dir_for_project(project_id)
-    return JSONStore(data_dir)
+    """Get JSONStore for current project (shared across requests)."""
+    return _store_for(get_project_id())
 
 
 def get_log_db() -> LogDatabase:
-    """Get LogDatabase for current project."""
-    project_id = get_project_id()
-    data_dir = get_data_dir_for_project(project_id)
-    db_path = data_dir / "skein.db"
-    return LogDatabase(db_path)
+    """Get LogDatabase for current project (shared across requests)."""
+    return _log_db_for(get_project_id())
 
 
 def create_app() -> FastAPI:
@@ -84,10 +150,7 @@ def create_app() -> FastAPI:
         version="0.1.0"
     )
 
-    templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
-
-    # Add custom filters
-    templates.env.filters['clean_title'] = clean_title
+    templates = Jinja2Templates(env=_template_env())
 
     # Mount static files if directory exists
     if STATIC_DIR.exists():
@@ -96,26 +159,22 @@ def create_app() -> FastAPI:
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request, store: JSONStore = Depends(get_store)):
         """Home page - activity feed."""
-        sites = store.get_sites()
-        folios = store.get_folios()
-        agents = store.get_agents()
+        sites, all_folios, agents = await _fetch(store.get_sites, store.get_folios, store.get_agents)
 
         # Filter to open only, compute status
         open_folios = []
-        for f in folios:
-            status = get_current_status(f.folio_id, store) or f.status or "open"
-            if status != "closed":
-                f.status = status
+        statuses = await run_in_threadpool(get_current_statuses, [f.folio_id for f in all_folios], store)
+        for f in all_folios:
+            if (statuses[f.folio_id] or f.status or "open") != "closed":
                 open_folios.append(f)
 
-        # Sort by created_at, newest first
-        open_folios.sort(key=lambda f: f.created_at, reverse=True)
-        folios = open_folios[:50]
+        # Newest 50 by created_at
+        folios = heapq.nlargest(50, open_folios, key=lambda f: f.created_at)
 
         return templates.TemplateResponse("home.html", {
             "request": request,
             "folios": folios,
-            "total_folios": len(store.get_folios()),
+            "total_folios": len(all_folios),
             "total_sites": len(sites),
             "active_agents": len([a for a in agents if a.status == "active"]),
             "project_id": get_project_id()
@@ -124,19 +183,22 @@ def create_app() -> FastAPI:
     @app.get("/sites", response_class=HTMLResponse)
     async def sites_list(request: Request, store: JSONStore = Depends(get_store)):
         """List all sites."""
-        sites = store.get_sites()
-        folios = store.get_folios()
+        sites, folios = await _fetch(store.get_sites, store.get_folios)
 
         # Count folios per site with type breakdown
         site_stats = {}
+        statuses = await run_in_threadpool(get_current_statuses, [f.folio_id for f in folios], store)
+        by_site = defaultdict(list)
+        for f in folios:
+            by_site[f.site_id].append(f)
         for site in sites:
             site_id = site.site_id
-            site_folios = [f for f in folios if f.site_id == site_id]
+            site_folios = by_site[site_id]
             by_type = {}
             by_status = {"open": 0, "closed": 0}
             for folio in site_folios:
                 # Compute status from threads
-                computed_status = get_current_status(folio.folio_id, store) or folio.status or "open"
+                computed_status = statuses[folio.folio_id] or folio.status or "open"
                 by_type[folio.type] = by_type.get(folio.type, 0) + 1
                 if computed_status == "closed":
                     by_status["closed"] += 1
@@ -165,38 +227,36 @@ def create_app() -> FastAPI:
         store: JSONStore = Depends(get_store)
     ):
         """Site detail view with folios."""
-        site = store.get_site(site_id)
+        site, all_folios = await _fetch(
+            partial(store.get_site, site_id),
+            partial(store.get_folios, site_id=site_id),
+        )
         if not site:
             raise HTTPException(status_code=404, detail=f"Site '{site_id}' not found")
 
-        folios = store.get_folios(site_id=site_id)
+        # Compute status from threads for each folio, once for both the
+        # listing and the filter dropdowns
+        folio_meta = await run_in_threadpool(_folio_meta, all_folios, store)
 
-        # Compute status from threads for each folio
-        for folio in folios:
-            folio.status = get_current_status(folio.folio_id, store) or folio.status or "open"
-            folio.assigned_to = get_current_assignment(folio.folio_id, store) or folio.assigned_to
+        # Get unique types and statuses for filter dropdowns
+        available_types = sorted(set(f.type for f in all_folios))
+        available_statuses = sorted(set(m.status for m in folio_meta.values()))
 
         # Apply filters
+        folios = all_folios
         if type:
             folios = [f for f in folios if f.type == type]
         if status:
-            folios = [f for f in folios if f.status == status]
+            folios = [f for f in folios if folio_meta[f.folio_id].status == status]
 
         # Sort by created_at, newest first
-        folios.sort(key=lambda f: f.created_at, reverse=True)
-
-        # Get unique types and statuses for filter dropdowns
-        all_folios = store.get_folios(site_id=site_id)
-        available_types = sorted(set(f.type for f in all_folios))
-        available_statuses = sorted(set(
-            get_current_status(f.folio_id, store) or f.status or "open"
-            for f in all_folios
-        ))
+        folios = sorted(folios, key=lambda f: f.created_at, reverse=True)
 
         return templates.TemplateResponse("site_detail.html", {
             "request": request,
             "site": site,
             "folios": folios,
+            "folio_meta": folio_meta,
             "current_type": type,
             "current_status": status,
             "available_types": available_types,
@@ -211,46 +271,28 @@ def create_app() -> FastAPI:
         store: JSONStore = Depends(get_store)
     ):
         """Folio detail view."""
-        folio = store.get_folio(folio_id)
+        folio = await run_in_threadpool(store.get_folio, folio_id)
         if not folio:
             raise HTTPException(status_code=404, detail=f"Folio '{folio_id}' not found")
 
-        # Compute status from threads
-        folio.status = get_current_status(folio.folio_id, store) or folio.status or "open"
-        folio.assigned_to = get_current_assignment(folio.folio_id, store) or folio.assigned_to
-
-        # Get threads related to this folio
-        threads = store.get_threads(from_id=folio_id)
-        threads += store.get_threads(to_id=folio_id)
-        # Dedupe
-        seen = set()
-        unique_threads = []
-        for t in threads:
-            if t.thread_id not in seen:
-                seen.add(t.thread_id)
-                unique_threads.append(t)
-        threads = sorted(unique_threads, key=lambda t: t.created_at)
-
-        # Get site info
-        site = store.get_site(folio.site_id)
-
         # Find cross-references (folio IDs mentioned in content)
-        import re
-        cross_refs = []
-        # Match patterns like brief-20251208-0jt9, issue-20251207-akrj, etc.
-        folio_id_pattern = r'\b(brief|issue|friction|finding|notion|summary|tender|plan|playbook|mantle|writ)-\d{8}-[a-z0-9]{4}\b'
-        mentioned_ids = re.findall(folio_id_pattern, folio.content, re.IGNORECASE) if folio.content else []
-        # Get full matches
-        full_matches = re.findall(r'\b(?:brief|issue|friction|finding|notion|summary|tender|plan|playbook|mantle|writ)-\d{8}-[a-z0-9]{4}\b', folio.content, re.IGNORECASE) if folio.content else []
-        for ref_id in set(full_matches):
-            if ref_id != folio_id:  # Don't self-reference
-                ref_folio = store.get_folio(ref_id)
-                if ref_folio:
-                    cross_refs.append(ref_folio)
+        ref_ids = {m.group(0) for m in _FOLIO_ID_RE.finditer(folio.content)} if folio.content else set()
+        ref_ids.discard(folio_id)  # Don't self-reference
+
+        # Status from threads, threads related to this folio, its site and
+        # the referenced folios
+        folio_meta, threads, site, *ref_folios = await _fetch(
+            partial(_folio_meta, [folio], store),
+            partial(store.get_threads_touching, folio_id),
+            partial(store.get_site, folio.site_id),
+            *(partial(store.get_folio, ref_id) for ref_id in ref_ids),
+        )
+        cross_refs = [ref_folio for ref_folio in ref_folios if ref_folio]
 
         return templates.TemplateResponse("folio_detail.html", {
             "request": request,
             "folio": folio,
+            "folio_meta": folio_meta,
             "site": site,
             "threads": threads,
             "cross_refs": cross_refs,
@@ -264,25 +306,20 @@ def create_app() -> FastAPI:
         store: JSONStore = Depends(get_store)
     ):
         """Activity log - recent folios and changes."""
-        folios = store.get_folios()
+        all_folios, all_threads = await _fetch(store.get_folios, store.get_threads)
 
-        # Compute status for each folio
-        for folio in folios:
-            folio.status = get_current_status(folio.folio_id, store) or folio.status or "open"
-            folio.assigned_to = get_current_assignment(folio.folio_id, store) or folio.assigned_to
+        # Newest folios first; only those shown need their status computed
+        folios = heapq.nlargest(limit, all_folios, key=lambda f: f.created_at)
 
-        # Sort by created_at, newest first
-        folios.sort(key=lambda f: f.created_at, reverse=True)
-        folios = folios[:limit]
+        folio_meta = await run_in_threadpool(_folio_meta, folios, store)
 
         # Get recent threads
-        threads = store.get_threads()
-        threads.sort(key=lambda t: t.created_at, reverse=True)
-        threads = threads[:limit]
+        threads = heapq.nlargest(limit, all_threads, key=lambda t: t.created_at)
 
         return templates.TemplateResponse("activity.html", {
             "request": request,
             "folios": folios,
+            "folio_meta": folio_meta,
             "threads": threads,
             "limit": limit,
             "project_id": get_project_id()
@@ -295,7 +332,7 @@ def create_app() -> FastAPI:
         store: JSONStore = Depends(get_store)
     ):
         """Agent roster view."""
-        agents = store.get_agents(status=status)
+        agents = await run_in_threadpool(store.get_agents, status=status)
         agents.sort(key=lambda a: a.registered_at, reverse=True)
 
         return templates.TemplateResponse("roster.html", {
@@ -316,36 +353,31 @@ def create_app() -> FastAPI:
         store: JSONStore = Depends(get_store)
     ):
         """HTMX partial: folio list."""
-        folios = store.get_folios(site_id=site_id)
+        folios = await run_in_threadpool(store.get_folios, site_id=site_id)
 
         # Compute status from threads
-        for folio in folios:
-            folio.status = get_current_status(folio.folio_id, store) or folio.status or "open"
-            folio.assigned_to = get_current_assignment(folio.folio_id, store) or folio.assigned_to
+        folio_meta = await run_in_threadpool(_folio_meta, folios, store)
 
         if type:
             folios = [f for f in folios if f.type == type]
         if status:
-            folios = [f for f in folios if f.status == status]
+            folios = [f for f in folios if folio_meta[f.folio_id].status == status]
 
         folios.sort(key=lambda f: f.created_at, reverse=True)
 
         return templates.TemplateResponse("partials/folio_list.html", {
             "request": request,
-            "folios": folios
+            "folios": folios,
+            "folio_meta": folio_meta
         })
 
     @app.get("/htmx/sites", response_class=HTMLResponse)
     async def htmx_sites(request: Request, store: JSONStore = Depends(get_store)):
         """HTMX partial: site list."""
-        sites = store.get_sites()
-        folios = store.get_folios()
+        sites, folios = await _fetch(store.get_sites, store.get_folios)
 
-        site_stats = {}
-        for site in sites:
-            site_id = site.site_id
-            site_folios = [f for f in folios if f.site_id == site_id]
-            site_stats[site_id] = {"total": len(site_folios)}
+        site_counts = Counter(f.site_id for f in folios)
+        site_stats = {site.site_id: {"total": site_counts[site.site_id]} for site in sites}
 
         return templates.TemplateResponse("partials/site_list.html", {
             "request": request,
@@ -356,11 +388,37 @@ def create_app() -> FastAPI:
     return app
 
 
-def run_server(host: str = "127.0.0.1", port: int = 8003, reload: bool = False):
-    """Run the SKEIN web server."""
-    app = create_app()
-    logger.info(f"Starting SKEIN Web UI on http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+def _server_impls() -> tuple:
+    """Pick the fastest event loop and HTTP parser that are installed."""
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    return loop, http
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8003, reload: bool = False,
+               workers: int = 1):
+    """Run the SKEIN web server.
+
+    With more than one worker (or reload), uvicorn needs an import string so each
+    process can build its own app through the factory.
+    """
+    loop, http = _server_impls()
+    logger.info(f"Starting SKEIN Web UI on http://{host}:{port} ({loop}/{http})")
+    if reload or workers > 1:
+        uvicorn.run("skein.web.app:create_app", factory=True, host=host, port=port,
+                    loop=loop, http=http, reload=reload,
+                    workers=None if reload else workers, log_level="info")
+    else:
+        uvicorn.run(create_app(), host=host, port=port, loop=loop, http=http,
+                    log_level="info")
 
 
 if __name__ == "__main__":
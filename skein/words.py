@@ -9,9 +9,14 @@ Criteria:
 - Mix of: tools, animals, materials, weather, objects
 """
 
+import hashlib
+import random
+from typing import Tuple
+
 # ~250 adjective-ish words
 # Colors, textures, qualities, states
-ADJECTIVES = [
+# Words repeated across categories are kept once so none is drawn more often
+ADJECTIVES = tuple(dict.fromkeys([
     # Colors and visual
     "amber", "azure", "bronze", "chrome", "cobalt", "copper", "coral",
     "crimson", "golden", "indigo", "ivory", "jade", "jet", "marble",
@@ -57,11 +62,11 @@ ADJECTIVES = [
     "stout", "strong", "sturdy", "subtle", "supple", "swift", "tender",
     "thorough", "tidy", "tough", "tranquil", "true", "trusty", "valiant",
     "vigilant", "vivid", "warm", "wary", "watchful", "wise", "witty",
-]
+]))
 
 # ~250 noun-ish words
 # Tools, animals, materials, weather phenomena, objects
-NOUNS = [
+NOUNS = tuple(dict.fromkeys([
     # Tools and implements
     "anvil", "awl", "axle", "beacon", "bellows", "blade", "bolt",
     "brace", "bucket", "cable", "chain", "chisel", "clamp", "clasp",
@@ -109,10 +114,25 @@ NOUNS = [
     "snow", "spring", "spruce", "storm", "strait", "stream", "summit",
     "surf", "swamp", "thaw", "thicket", "thorn", "tide", "timber",
     "vale", "wave", "willow",
-]
+]))
+
+_N_ADJ = len(ADJECTIVES)
+_N_NOUN = len(NOUNS)
+_ADJECTIVES_SET = frozenset(ADJECTIVES)
+_NOUNS_SET = frozenset(NOUNS)
+_randrange = random.randrange
+
 
+def _seeded_indices(seed) -> Tuple[int, int]:
+    """Map a seed to fixed (adjective, noun) indices without building an RNG."""
+    digest = hashlib.blake2s(str(seed).encode(), digest_size=8).digest()
+    return (
+        int.from_bytes(digest[:4], "little") % _N_ADJ,
+        int.from_bytes(digest[4:], "little") % _N_NOUN,
+    )
 
-def get_word_pair(seed: int = None) -> tuple[str, str]:
+
+def get_word_pair(seed: int = None) -> Tuple[str, str]:
     """
     Get a random adjective-noun pair.
 
@@ -122,14 +142,43 @@ def get_word_pair(seed: int = None) -> tuple[str, str]:
     Returns:
         Tuple of (adjective, noun)
     """
-    import random
+    if seed is not None:
+        i, j = _seeded_indices(seed)
+        return ADJECTIVES[i], NOUNS[j]
+
+    # The shared module RNG is already seeded from the OS; no per-call state
+    return ADJECTIVES[_randrange(_N_ADJ)], NOUNS[_randrange(_N_NOUN)]
+
+
+def get_word_name(seed: int = None, sep: str = "-") -> str:
+    """
+    Get a random adjective-noun pair already joined, e.g. "chrome-badger".
+
+    Draws the same pair as get_word_pair for a given seed.
+
+    Args:
+        seed: Optional seed for deterministic selection
+        sep: Separator between the two words
 
+    Returns:
+        Joined name string
+    """
     if seed is not None:
-        rng = random.Random(seed)
-    else:
-        rng = random.Random()
+        i, j = _seeded_indices(seed)
+        return ADJECTIVES[i] + sep + NOUNS[j]
+
+    return ADJECTIVES[_randrange(_N_ADJ)] + sep + NOUNS[_randrange(_N_NOUN)]
 
-    adj = rng.choice(ADJECTIVES)
-    noun = rng.choice(NOUNS)
 
-    return adj, noun
+def is_valid_pair(adj: str, noun: str) -> bool:
+    """
+    Check whether an adjective-noun pair comes from these word lists.
+
+    Args:
+        adj: Candidate adjective
+        noun: Candidate noun
+
+    Returns:
+        True if adj is in ADJECTIVES and noun is in NOUNS
+    """
+    return adj in _ADJECTIVES_SET and noun in _NOUNS_SET
@@ -5,24 +5,71 @@ SKEIN Server - Structured Knowledge Exchange & Integration Nexus
 Standalone server for inter-agent collaboration.
 """
 
+import atexit
 import logging
+import queue
 import os
 import json
-import uuid
+import secrets
 import contextvars
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache
 from pathlib import Path
 import uvicorn
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from skein.routes import router as skein_router
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
 # Context variable for request ID - accessible throughout the request lifecycle
 request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (about 3-10x faster than stdlib json)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Default response class for the API: orjson when installed, stdlib otherwise
+APIResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+
+CONFIG_FILE = Path(__file__).parent / "config" / "config.json"
+
+
+@lru_cache(maxsize=1)
+def _file_config() -> dict:
+    """Server settings from the config file (read once per process)."""
+    try:
+        with open(CONFIG_FILE) as f:
+            return json.load(f).get("server", {})
+    except Exception:
+        return {}
+
+
 def get_config():
     """Load configuration from environment variables and config file."""
     config = {
@@ -31,72 +78,111 @@ def get_config():
         "log_level": "info"
     }
 
-    # Try to load from config file
-    config_file = Path(__file__).parent / "config" / "config.json"
-    if config_file.exists():
-        try:
-            with open(config_file) as f:
-                file_config = json.load(f)
-                if "server" in file_config:
-                    config.update(file_config["server"])
-        except Exception:
-            pass
+    # Config file overrides defaults
+    config.update(_file_config())
 
     # Environment variables take precedence
-    if os.getenv("SKEIN_HOST"):
-        config["host"] = os.getenv("SKEIN_HOST")
-    if os.getenv("SKEIN_PORT"):
-        config["port"] = int(os.getenv("SKEIN_PORT"))
-    if os.getenv("SKEIN_LOG_LEVEL"):
-        config["log_level"] = os.getenv("SKEIN_LOG_LEVEL")
+    if host := os.environ.get("SKEIN_HOST"):
+        config["host"] = host
+    if port := os.environ.get("SKEIN_PORT"):
+        config["port"] = int(port)
+    if log_level := os.environ.get("SKEIN_LOG_LEVEL"):
+        config["log_level"] = log_level
 
     return config
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to add request ID tracking to all API calls.
 
     - Uses X-Request-ID header if provided by client
-    - Otherwise generates a new UUID
+    - Otherwise generates a random 32-hex-digit ID
     - Sets request ID in context var for use in logging
     - Returns X-Request-ID header in response
+
+    Plain ASGI rather than BaseHTTPMiddleware, so requests don't pay for a
+    task group and a streamed call_next.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request_id = Headers(scope=scope).get("x-request-id") or secrets.token_hex(16)
 
         # Store in context var for access throughout request
         request_id_var.set(request_id)
 
         # Also attach to request state for easy access in handlers
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Log the incoming request with request ID
-        logger.info(f"[{request_id}] {request.method} {request.url.path}")
+        logger.info(f"[{request_id}] {scope['method']} {scope['path']}")
 
-        # Process the request
-        response = await call_next(request)
+        async def send_with_request_id(message: Message):
+            # Add request ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        await self.app(scope, receive, send_with_request_id)
 
-        return response
+
+# Paths hit by liveness probes and other non-browser pollers
+_PROBE_PATHS = frozenset({"/", "/health"})
+
+
+class ProbeAwareCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that lets Origin-less requests to probe paths bypass it."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] in _PROBE_PATHS
+            and not any(name == b"origin" for name, _ in scope["headers"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+def _configure_logging():
+    """
+    Log through a queue so request handlers only enqueue records; a listener
+    thread formats them and writes to stderr. No-op if logging is already set
+    up, like logging.basicConfig.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
     title="SKEIN API",
     description="Structured Knowledge Exchange & Integration Nexus - Agent collaboration infrastructure",
-    version="0.2.0"
+    version="0.2.0",
+    default_response_class=APIResponse
 )
 
 # Global exception handler for unhandled errors
@@ -106,14 +192,19 @@ async def global_exception_handler(request: Request, exc: Exception):
     Catch-all exception handler to prevent 500 errors from crashing requests.
     Logs full stack trace and returns structured error response with request ID.
     """
-    request_id = getattr(request.state, "request_id", None) or request_id_var.get() or "unknown"
+    try:
+        # Set on every request by RequestIDMiddleware
+        request_id = request.state.request_id
+    except AttributeError:
+        # The middleware itself failed before tagging the request
+        request_id = request_id_var.get() or "unknown"
 
     logger.error(
         f"[{request_id}] Unhandled exception on {request.method} {request.url.path}: {type(exc).__name__}: {exc}",
         exc_info=True
     )
 
-    response = JSONResponse(
+    response = APIResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -131,7 +222,7 @@ app.add_middleware(RequestIDMiddleware)
 
 # CORS middleware (allow all origins for development)
 app.add_middleware(
-    CORSMiddleware,
+    ProbeAwareCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
@@ -143,37 +234,49 @@ app.add_middleware(
 app.include_router(skein_router, prefix="/skein", tags=["skein"])
 
 
+# Constant bodies for / and /health, encoded once at import
+_ROOT_BODY = json.dumps({
+    "name": "SKEIN API",
+    "version": "0.2.0",
+    "description": "Structured Knowledge Exchange & Integration Nexus",
+    "docs": "/docs"
+}, separators=(",", ":")).encode()
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API info."""
-    return {
-        "name": "SKEIN API",
-        "version": "0.2.0",
-        "description": "Structured Knowledge Exchange & Integration Nexus",
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+_BANNER_RULE = "=" * 80
 
 
 if __name__ == "__main__":
     config = get_config()
 
-    logger.info("=" * 80)
-    logger.info("🧵 Starting SKEIN Server")
-    logger.info("=" * 80)
-    logger.info(f"Host: {config['host']}")
-    logger.info(f"Port: {config['port']}")
-    logger.info(f"Docs: http://localhost:{config['port']}/docs")
-    logger.info("=" * 80)
+    logger.info("\n".join([
+        _BANNER_RULE,
+        "🧵 Starting SKEIN Server",
+        _BANNER_RULE,
+        f"Host: {config['host']}",
+        f"Port: {config['port']}",
+        f"Docs: http://localhost:{config['port']}/docs",
+        _BANNER_RULE,
+    ]))
 
     uvicorn.run(
         app,
         host=config["host"],
         port=config["port"],
-        log_level=config["log_level"]
+        log_level=config["log_level"],
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11"
     )
@@ -33,11 +33,14 @@ def pytest_configure(config):
     else:
         registry = {"projects": {}}
 
-    # Add test project
-    registry["projects"]["test-project"] = {
+    # Add test project (nothing to write if it's already registered)
+    test_project = {
         "data_dir": str(test_project_dir),
         "name": "test-project"
     }
+    if registry["projects"].get("test-project") == test_project:
+        return
+    registry["projects"]["test-project"] = test_project
 
     # Save registry
     with open(registry_file, "w") as f:
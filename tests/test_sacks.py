@@ -17,9 +17,14 @@ def test_db():
         db_path = Path(f.name)
 
     db = LogDatabase(db_path)
+    # Throwaway database: skip fsyncs (the WAL journal mode set by LogDatabase
+    # already keeps commits cheap; this drops the checkpoint syncs too)
+    with db._get_connection() as conn:
+        conn.execute("PRAGMA synchronous=OFF")
     yield db
 
     # Cleanup
+    db.close()
     db_path.unlink(missing_ok=True)
 
 
@@ -84,36 +89,32 @@ class TestSackStorage:
 
     def test_get_chain_yields_ordering(self, test_db):
         """Test getting yields in chain order."""
-        import time
-
-        # Add yields in reverse order with slight delay
-        test_db.add_yield(
-            sack_id="yield-chain-3",
-            chain_id="chain-ordering-test",
-            task_id="task_0003",
-            status="complete",
-            outcome="Third task",
-        )
-        time.sleep(0.01)  # Ensure timestamp difference
-
-        test_db.add_yield(
-            sack_id="yield-chain-1",
-            chain_id="chain-ordering-test",
-            task_id="task_0001",
-            status="complete",
-            outcome="First task",
-        )
-        time.sleep(0.01)
-
-        test_db.add_yield(
-            sack_id="yield-chain-2",
-            chain_id="chain-ordering-test",
-            task_id="task_0002",
-            status="partial",
-            outcome="Second task",
-        )
-
-        # Get chain yields (should be in timestamp order, not insert order)
+        # Add yields in reverse task order, in one batch
+        assert test_db.add_yields([
+            {
+                "sack_id": "yield-chain-3",
+                "chain_id": "chain-ordering-test",
+                "task_id": "task_0003",
+                "status": "complete",
+                "outcome": "Third task",
+            },
+            {
+                "sack_id": "yield-chain-1",
+                "chain_id": "chain-ordering-test",
+                "task_id": "task_0001",
+                "status": "complete",
+                "outcome": "First task",
+            },
+            {
+                "sack_id": "yield-chain-2",
+                "chain_id": "chain-ordering-test",
+                "task_id": "task_0002",
+                "status": "partial",
+                "outcome": "Second task",
+            },
+        ]) == 3
+
+        # Get chain yields (timestamp order, ties in insert order - not task order)
         yields = test_db.get_chain_yields("chain-ordering-test")
         assert len(yields) == 3
         # Note: ordering is by timestamp, so will be 3, 1, 2
@@ -124,27 +125,14 @@ class TestSackStorage:
     def test_get_yields_by_status(self, test_db):
         """Test filtering yields by status."""
         # Add yields with different statuses
-        test_db.add_yield(
-            sack_id="yield-status-1",
-            chain_id="chain-1",
-            task_id="task_1",
-            status="complete",
-            outcome="Done",
-        )
-        test_db.add_yield(
-            sack_id="yield-status-2",
-            chain_id="chain-2",
-            task_id="task_2",
-            status="blocked",
-            outcome="Needs human review",
-        )
-        test_db.add_yield(
-            sack_id="yield-status-3",
-            chain_id="chain-3",
-            task_id="task_3",
-            status="blocked",
-            outcome="Also blocked",
-        )
+        test_db.add_yields([
+            {"sack_id": "yield-status-1", "chain_id": "chain-1", "task_id": "task_1",
+             "status": "complete", "outcome": "Done"},
+            {"sack_id": "yield-status-2", "chain_id": "chain-2", "task_id": "task_2",
+             "status": "blocked", "outcome": "Needs human review"},
+            {"sack_id": "yield-status-3", "chain_id": "chain-3", "task_id": "task_3",
+             "status": "blocked", "outcome": "Also blocked"},
+        ])
 
         blocked = test_db.get_yields_by_status("blocked")
         assert len(blocked) == 2
@@ -156,30 +144,14 @@ class TestSackStorage:
 
     def test_get_agent_yields(self, test_db):
         """Test getting yields by agent."""
-        test_db.add_yield(
-            sack_id="yield-agent-1",
-            chain_id="chain-1",
-            task_id="task_1",
-            agent_id="agent-alice",
-            status="complete",
-            outcome="Alice's work",
-        )
-        test_db.add_yield(
-            sack_id="yield-agent-2",
-            chain_id="chain-1",
-            task_id="task_2",
-            agent_id="agent-bob",
-            status="complete",
-            outcome="Bob's work",
-        )
-        test_db.add_yield(
-            sack_id="yield-agent-3",
-            chain_id="chain-2",
-            task_id="task_3",
-            agent_id="agent-alice",
-            status="partial",
-            outcome="More Alice work",
-        )
+        test_db.add_yields([
+            {"sack_id": "yield-agent-1", "chain_id": "chain-1", "task_id": "task_1",
+             "agent_id": "agent-alice", "status": "complete", "outcome": "Alice's work"},
+            {"sack_id": "yield-agent-2", "chain_id": "chain-1", "task_id": "task_2",
+             "agent_id": "agent-bob", "status": "complete", "outcome": "Bob's work"},
+            {"sack_id": "yield-agent-3", "chain_id": "chain-2", "task_id": "task_3",
+             "agent_id": "agent-alice", "status": "partial", "outcome": "More Alice work"},
+        ])
 
         alice_yields = test_db.get_agent_yields("agent-alice")
         assert len(alice_yields) == 2
@@ -187,35 +159,15 @@ class TestSackStorage:
 
     def test_get_previous_yield(self, test_db):
         """Test getting previous yield in a chain."""
-        import time
-
         # Add chain yields in order
-        test_db.add_yield(
-            sack_id="yield-prev-1",
-            chain_id="chain-sequential",
-            task_id="task_0001",
-            status="complete",
-            outcome="First",
-            notes="Context for second",
-        )
-        time.sleep(0.01)
-
-        test_db.add_yield(
-            sack_id="yield-prev-2",
-            chain_id="chain-sequential",
-            task_id="task_0002",
-            status="complete",
-            outcome="Second",
-        )
-        time.sleep(0.01)
-
-        test_db.add_yield(
-            sack_id="yield-prev-3",
-            chain_id="chain-sequential",
-            task_id="task_0003",
-            status="complete",
-            outcome="Third",
-        )
+        test_db.add_yields([
+            {"sack_id": "yield-prev-1", "chain_id": "chain-sequential", "task_id": "task_0001",
+             "status": "complete", "outcome": "First", "notes": "Context for second"},
+            {"sack_id": "yield-prev-2", "chain_id": "chain-sequential", "task_id": "task_0002",
+             "status": "complete", "outcome": "Second"},
+            {"sack_id": "yield-prev-3", "chain_id": "chain-sequential", "task_id": "task_0003",
+             "status": "complete", "outcome": "Third"},
+        ])
 
         # Get previous yield before task_0003
         prev = test_db.get_previous_yield("chain-sequential", "task_0003")
@@ -241,3 +193,123 @@ class TestSackStorage:
         """Test getting yields from an empty/nonexistent chain."""
         yields = test_db.get_chain_yields("chain-does-not-exist")
         assert yields == []
+
+    def test_failed_write_does_not_poison_connection(self, test_db):
+        """Test that a rejected insert leaves the reused connection usable."""
+        import sqlite3
+
+        test_db.add_yield(sack_id="yield-dup", chain_id="chain-x", task_id="task_0001")
+        with pytest.raises(sqlite3.IntegrityError):
+            test_db.add_yield(sack_id="yield-dup", chain_id="chain-x", task_id="task_0002")
+
+        test_db.add_yield(sack_id="yield-next", chain_id="chain-x", task_id="task_0003")
+
+        # A separate connection sees both committed rows
+        conn = sqlite3.connect(str(test_db.db_path))
+        try:
+            rows = conn.execute(
+                "SELECT sack_id FROM sacks WHERE chain_id = ? ORDER BY id", ("chain-x",)
+            ).fetchall()
+        finally:
+            conn.close()
+        assert [row[0] for row in rows] == ["yield-dup", "yield-next"]
+
+
+class TestLogSearch:
+    """Test full-text search over log lines."""
+
+    def test_search_finds_new_lines_and_honors_filters(self, test_db):
+        """Test that inserted lines are indexed and filters still apply."""
+        test_db.add_logs("stream-a", "test", [
+            {"message": "connection refused by upstream", "level": "ERROR"},
+            {"message": "connection established", "level": "INFO"},
+            {"message": "unrelated line", "level": "ERROR"},
+        ])
+        test_db.add_logs("stream-b", "test", [{"message": "connection refused", "level": "ERROR"}])
+
+        hits = test_db.get_logs("stream-a", search="connection")
+        assert sorted(h.message for h in hits) == [
+            "connection established", "connection refused by upstream"
+        ]
+
+        errors = test_db.get_logs("stream-a", search="connection", level="ERROR")
+        assert [h.message for h in errors] == ["connection refused by upstream"]
+
+        # Prefix queries use the prefix index
+        assert len(test_db.get_logs("stream-a", search="conn*")) == 2
+
+    def test_metadata_filter(self, test_db):
+        """Test filtering log lines on metadata keys inside SQLite."""
+        test_db.add_logs("stream-m", "test", [
+            {"message": "one", "metadata": {"agent_id": "alice", "step": 1}},
+            {"message": "two", "metadata": {"agent_id": "bob"}},
+            {"message": "three"},
+        ])
+
+        hits = test_db.get_logs("stream-m", meta_filter={"agent_id": "alice"})
+        assert [h.message for h in hits] == ["one"]
+        assert hits[0].metadata == {"agent_id": "alice", "step": 1}
+        assert test_db.get_logs("stream-m", meta_filter={"agent_id": "carol"}) == []
+
+    def test_metadata_filter_matches_json_types(self, test_db):
+        """Test that numeric and boolean metadata match typed filter values."""
+        test_db.add_logs("stream-t", "test", [
+            {"message": "number", "metadata": {"step": 1, "done": True}},
+            {"message": "text", "metadata": {"step": "1", "done": False}},
+        ])
+
+        assert [h.message for h in test_db.get_logs("stream-t", meta_filter={"step": 1})] == ["number"]
+        assert [h.message for h in test_db.get_logs("stream-t", meta_filter={"step": "1"})] == ["text"]
+        assert [h.message for h in test_db.get_logs("stream-t", meta_filter={"done": True})] == ["number"]
+
+        with pytest.raises(ValueError):
+            test_db.get_logs("stream-t", meta_filter={'a"b': 1})
+
+    def test_logs_route_meta_param(self, test_db):
+        """Test that the route coerces key=value filters and rejects bad keys."""
+        import asyncio
+        from fastapi import HTTPException
+        from skein.routes import get_logs
+
+        test_db.add_logs("stream-r", "test", [
+            {"message": "number", "metadata": {"step": 1, "run": "123"}},
+            {"message": "text", "metadata": {"step": "1", "agent_id": "alice"}},
+        ])
+
+        def route(*meta):
+            hits = asyncio.run(get_logs("stream-r", limit=1000, meta=list(meta), log_db=test_db))
+            return [h.message for h in hits]
+
+        assert route("step=1") == ["number"]
+        assert route('step="1"') == ["text"]
+        assert route("agent_id=alice") == ["text"]
+        assert route('run="123"') == ["number"]
+
+        for bad in ("no-separator", 'a"b=1'):
+            with pytest.raises(HTTPException) as exc:
+                route(bad)
+            assert exc.value.status_code == 400
+
+
+class TestScreenshots:
+    """Test screenshot metadata storage."""
+
+    def test_add_screenshots_batch(self, test_db):
+        """Test that a batch insert stores every row and the single-row API still works."""
+        shots = [
+            {
+                "screenshot_id": f"ss-{i}",
+                "strand_id": "strand-1",
+                "turn_number": i,
+                "label": f"step {i}",
+                "file_path": f"/tmp/ss-{i}.png",
+                "file_size": 100 + i,
+                "metadata": {"width": 800} if i else {},
+            }
+            for i in range(3)
+        ]
+        assert test_db.add_screenshots(shots) == 3
+        assert test_db.add_screenshot("ss-3", "strand-1", None, "last", "/tmp/ss-3.png", 1, {}) is True
+
+        stored = test_db.get_screenshots(strand_id="strand-1")
+        assert sorted(s["screenshot_id"] for s in stored) == ["ss-0", "ss-1", "ss-2", "ss-3"]
@@ -12,6 +12,7 @@ Run with: pytest tests/test_shard.py -v
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
 import threading
@@ -76,42 +77,49 @@ requires_git_238 = pytest.mark.skipif(
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Generator[Path, None, None]:
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory) -> Path:
     """
-    Create a temporary git repository with an initial commit.
+    Build a git repository with an initial commit once per test session.
 
-    This fixture provides an isolated git environment for each test,
-    preventing test pollution and making tests reproducible.
+    Tests get their own copy through temp_git_repo, so the git subprocesses
+    run once instead of once per test.
     """
-    repo_path = tmp_path / "test_repo"
+    repo_path = tmp_path_factory.mktemp("repo_template") / "test_repo"
     repo_path.mkdir()
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=repo_path, check=True, capture_output=True
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path, check=True, capture_output=True
-    )
-
-    # Create initial commit (required for worktrees)
+    # Create initial commit (required for worktrees) on master. One shell
+    # runs the whole sequence; HEAD points at master before the first commit,
+    # so no branch rename is needed afterwards
     readme = repo_path / "README.md"
     readme.write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
     subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
+        [
+            "sh", "-c",
+            "git init -q"
+            " && git config user.email test@example.com"
+            " && git config user.name 'Test User'"
+            " && git symbolic-ref HEAD refs/heads/master"
+            " && git add ."
+            " && git commit -q -m 'Initial commit'",
+        ],
         cwd=repo_path, check=True, capture_output=True
     )
 
-    # Ensure we're on master branch
-    subprocess.run(
-        ["git", "branch", "-M", "master"],
-        cwd=repo_path, check=True, capture_output=True
-    )
+    return repo_path
+
+
+@pytest.fixture
+def temp_git_repo(tmp_path: Path, _git_repo_template: Path) -> Generator[Path, None, None]:
+    """
+    Create a temporary git repository with an initial commit.
+
+    This fixture provides an isolated git environment for each test,
+    preventing test pollution and making tests reproducible. Each test gets
+    a private copy of the session's template repo.
+    """
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(_git_repo_template, repo_path)
 
     yield repo_path
 
@@ -809,6 +817,33 @@ class TestMergeWithCommits:
         ).stdout
         assert "Merge" in log
 
+    @requires_git_238
+    def test_fast_forward_merge_skips_merge_commit(self, shard_env: Path):
+        """WHY: --ff moves master to the branch tip when master hasn't moved."""
+        info = spawn_shard("ff-test")
+        worktree_path = Path(info["worktree_path"])
+
+        (worktree_path / "file.txt").write_text("content")
+        subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Feature"],
+            cwd=worktree_path, check=True, capture_output=True
+        )
+        branch_sha = subprocess.run(
+            ["git", "rev-parse", info["branch_name"]],
+            cwd=shard_env, capture_output=True, text=True
+        ).stdout.strip()
+
+        result = merge_shard(info["worktree_name"], fast_forward=True)
+        assert result["success"]
+
+        master_sha = subprocess.run(
+            ["git", "rev-parse", "master"],
+            cwd=shard_env, capture_output=True, text=True
+        ).stdout.strip()
+        assert master_sha == branch_sha
+        assert (shard_env / "file.txt").read_text() == "content"
+
 
 class TestGetShardDiff:
     """Test diff retrieval functionality."""
@@ -1611,6 +1646,26 @@ class TestGetTenderMetadata:
         finally:
             cleanup_shard(info["worktree_name"])
 
+    def test_last_commit_message_tracks_new_commits(self, shard_env: Path):
+        """WHY: The cat-file batcher is long-lived; it must see later commits."""
+        info = spawn_shard("tender-message-test")
+        worktree_path = Path(info["worktree_path"])
+
+        try:
+            for i in range(2):
+                (worktree_path / f"file{i}.txt").write_text(f"content {i}")
+                subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+                subprocess.run(
+                    ["git", "commit", "-m", f"Subject {i}\n\nBody {i}"],
+                    cwd=worktree_path, check=True, capture_output=True
+                )
+
+                metadata = get_tender_metadata(info["worktree_name"])
+                assert metadata["last_commit_message"] == f"Subject {i}\n\nBody {i}"
+
+        finally:
+            cleanup_shard(info["worktree_name"])
+
 
 # =============================================================================
 # BUG FIX REGRESSION TESTS
@@ -1995,6 +2050,35 @@ class TestConflictDetection:
         finally:
             cleanup_shard(info["worktree_name"])
 
+    @requires_git_238
+    def test_conflict_files_parsed_from_merge_tree(self, shard_env: Path):
+        """WHY: QM needs to know which files conflict, not just that some do."""
+        info = spawn_shard("conflict-files-test")
+        worktree_path = Path(info["worktree_path"])
+
+        try:
+            # Modify an existing file on both sides ("changed in both" section)
+            (worktree_path / "README.md").write_text("shard readme\n")
+            subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Shard readme"],
+                cwd=worktree_path, check=True, capture_output=True
+            )
+
+            (shard_env / "README.md").write_text("master readme\n")
+            subprocess.run(["git", "add", "."], cwd=shard_env, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Master readme"],
+                cwd=shard_env, check=True, capture_output=True
+            )
+
+            drift = get_shard_drift_info(info["worktree_name"])
+            assert drift["conflict_status"] == "conflict"
+            assert drift["conflict_files"] == ["README.md"]
+
+        finally:
+            cleanup_shard(info["worktree_name"])
+
     def test_no_conflict_with_non_overlapping_changes(self, shard_env: Path):
         """WHY: Should correctly identify clean integration."""
         info = spawn_shard("clean-test")
@@ -2116,6 +2200,30 @@ class TestGraftCreation:
         finally:
             cleanup_graft_chain(info["worktree_name"])
 
+    def test_graft_without_pygit2(self, shard_env: Path, monkeypatch):
+        """WHY: pygit2 is optional; the git CLI path must produce the same graft."""
+        import skein.shard as shard_module
+        monkeypatch.setattr(shard_module, "pygit2", None)
+
+        info = spawn_shard("no-pygit2-test")
+        worktree_path = Path(info["worktree_path"])
+
+        try:
+            for i in range(2):
+                (worktree_path / f"file{i}.py").write_text(f"content {i}")
+                subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+                subprocess.run(
+                    ["git", "commit", "-m", f"Commit {i}"],
+                    cwd=worktree_path, check=True, capture_output=True
+                )
+
+            graft_result = graft_shard(info["worktree_name"])
+            assert graft_result["success"]
+            assert graft_result["commits_applied"] == 2
+
+        finally:
+            cleanup_graft_chain(info["worktree_name"])
+
 
 class TestGraftConflictHandling:
     """
@@ -2157,6 +2265,75 @@ class TestGraftConflictHandling:
         finally:
             cleanup_graft_chain(info["worktree_name"])
 
+    def test_graft_reports_modify_delete_conflict(self, shard_env: Path):
+        """WHY: Conflicts other than both-modified (e.g. deleted on master) must surface."""
+        info = spawn_shard("modify-delete-graft-test")
+        worktree_path = Path(info["worktree_path"])
+
+        try:
+            (worktree_path / "README.md").write_text("shard edit\n")
+            subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Shard edit"],
+                cwd=worktree_path, check=True, capture_output=True
+            )
+
+            subprocess.run(["git", "rm", "-q", "README.md"], cwd=shard_env, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Master delete"],
+                cwd=shard_env, check=True, capture_output=True
+            )
+
+            graft_result = graft_shard(info["worktree_name"])
+
+            assert not graft_result["success"]
+            assert graft_result["conflicts"] == ["README.md"]
+
+        finally:
+            cleanup_graft_chain(info["worktree_name"])
+
+    def test_failed_graft_leaves_no_metadata(self, shard_env: Path):
+        """WHY: A graft that failed to apply must leave neither a worktree nor a chain row."""
+        info = spawn_shard("failed-graft-test")
+        worktree_path = Path(info["worktree_path"])
+        graft_name = f"{info['worktree_name']}-graft"
+
+        try:
+            (worktree_path / "feature.py").write_text("shard work\n")
+            subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Shard work"],
+                cwd=worktree_path, check=True, capture_output=True
+            )
+
+            # A merge commit in the range makes cherry-pick fail without a
+            # conflict (no -m given)
+            subprocess.run(
+                ["git", "checkout", "-q", "-b", "side", "HEAD~1"],
+                cwd=worktree_path, check=True
+            )
+            (worktree_path / "side.py").write_text("side work\n")
+            subprocess.run(["git", "add", "."], cwd=worktree_path, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Side work"],
+                cwd=worktree_path, check=True, capture_output=True
+            )
+            subprocess.run(["git", "checkout", "-q", "-"], cwd=worktree_path, check=True)
+            subprocess.run(
+                ["git", "merge", "--no-ff", "-m", "Merge side", "side"],
+                cwd=worktree_path, check=True, capture_output=True
+            )
+
+            with pytest.raises(ShardError):
+                graft_shard(info["worktree_name"])
+
+            assert _get_shard_metadata(graft_name) is None
+            assert not (get_worktrees_dir() / graft_name).exists()
+            assert get_graft_chain(info["worktree_name"]) == [info["worktree_name"]]
+
+        finally:
+            cleanup_graft_chain(info["worktree_name"])
+
 
 class TestGraftChainManagement:
     """
@@ -2169,6 +2346,168 @@ class TestGraftChainManagement:
         assert get_graft_chain_root("my-shard-001-graft") == "my-shard-001"
         assert get_graft_chain_root("my-shard-001-graft-graft") == "my-shard-001"
 
+    def test_get_graft_chain_root_follows_recorded_parents(self, shard_env: Path):
+        """WHY: SQLite parent links are authoritative over name suffixes."""
+        from datetime import datetime
+
+        now = datetime.now()
+        _record_shard_metadata("root-wt", "abc123", now)
+        _record_shard_metadata("child-wt", "abc123", now, parent_worktree="root-wt")
+        _record_shard_metadata("grandchild-wt", "abc123", now, parent_worktree="child-wt")
+
+        assert get_graft_chain_root("grandchild-wt") == "root-wt"
+        assert get_graft_chain_root("root-wt") == "root-wt"
+
+    def test_get_graft_chain_root_forgets_root_given_a_parent(self, shard_env: Path):
+        """WHY: A root must not outlive a re-recorded parent link."""
+        from datetime import datetime
+
+        now = datetime.now()
+        _record_shard_metadata("adopted-wt", "abc123", now)
+        assert get_graft_chain_root("adopted-wt") == "adopted-wt"
+
+        _record_shard_metadata("adopted-wt", "abc123", now, parent_worktree="foster-wt")
+        assert get_graft_chain_root("adopted-wt") == "foster-wt"
+
+    def test_get_graft_chain_root_terminates_on_cycle(self, shard_env: Path):
+        """WHY: A corrupted parent cycle must not hang chain walks."""
+        from datetime import datetime
+
+        now = datetime.now()
+        _record_shard_metadata("cycle-a", "abc123", now, parent_worktree="cycle-b")
+        _record_shard_metadata("cycle-b", "abc123", now, parent_worktree="cycle-a")
+
+        assert get_graft_chain_root("cycle-a") in ("cycle-a", "cycle-b")
+
+    def test_get_graft_chain_from_any_member(self, shard_env: Path):
+        """WHY: Chain lookup must return root -> leaf, skipping removed worktrees."""
+        from datetime import datetime
+
+        now = datetime.now()
+        _record_shard_metadata("lineage-001", "abc123", now)
+        _record_shard_metadata("lineage-001-graft", "abc123", now, parent_worktree="lineage-001")
+        _record_shard_metadata(
+            "lineage-001-graft-graft", "abc123", now, parent_worktree="lineage-001-graft"
+        )
+
+        worktrees_dir = get_worktrees_dir()
+        worktrees_dir.mkdir(exist_ok=True)
+        for name in ("lineage-001", "lineage-001-graft-graft"):
+            (worktrees_dir / name).mkdir()
+
+        expected = ["lineage-001", "lineage-001-graft-graft"]
+        assert get_graft_chain("lineage-001") == expected
+        assert get_graft_chain("lineage-001-graft") == expected
+        assert get_graft_chain("lineage-001-graft-graft") == expected
+
+    def test_chain_root_follows_reparented_ancestor(self, shard_env: Path):
+        """WHY: Stored roots must move with a subtree when an ancestor gains a parent."""
+        from datetime import datetime
+
+        now = datetime.now()
+        _record_shard_metadata("mid-wt", "abc123", now)
+        _record_shard_metadata("leaf-wt", "abc123", now, parent_worktree="mid-wt")
+        assert get_graft_chain_root("leaf-wt") == "mid-wt"
+
+        _record_shard_metadata("mid-wt", "abc123", now, parent_worktree="top-wt")
+        assert get_graft_chain_root("leaf-wt") == "top-wt"
+        assert _get_shard_metadata("leaf-wt")["depth"] == 2
+
+    def test_chain_columns_backfilled_for_legacy_database(self, shard_env: Path):
+        """WHY: Databases written before root/depth columns existed must still resolve chains."""
+        import sqlite3
+
+        db_path = shard_env / ".skein" / "shards.db"
+        db_path.parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript("""
+            CREATE TABLE shards (
+                worktree_name TEXT PRIMARY KEY,
+                parent_worktree TEXT,
+                base_commit TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                spawned_by TEXT,
+                brief_id TEXT,
+                description TEXT,
+                status TEXT DEFAULT 'active',
+                tendered_at TIMESTAMP,
+                merged_at TIMESTAMP,
+                confidence INTEGER
+            );
+            INSERT INTO shards (worktree_name, parent_worktree, base_commit, created_at)
+            VALUES ('old-001', NULL, 'abc123', '2026-01-01'),
+                   ('old-001-graft', 'old-001', 'abc123', '2026-01-01'),
+                   ('old-001-graft-graft', 'old-001-graft', 'abc123', '2026-01-01');
+        """)
+        conn.close()
+
+        assert get_graft_chain_root("old-001-graft-graft") == "old-001"
+        assert _get_shard_metadata("old-001-graft-graft")["depth"] == 2
+
+    def test_graft_chain_sees_newly_recorded_child(self, shard_env: Path):
+        """WHY: Chain walks must not hide a graft recorded afterwards."""
+        from datetime import datetime
+
+        now = datetime.now()
+        worktrees_dir = get_worktrees_dir()
+        worktrees_dir.mkdir(exist_ok=True)
+        (worktrees_dir / "cached-001").mkdir()
+        (worktrees_dir / "cached-001-next").mkdir()
+
+        _record_shard_metadata("cached-001", "abc123", now)
+        assert get_graft_chain("cached-001") == ["cached-001"]
+
+        _record_shard_metadata("cached-001-next", "abc123", now, parent_worktree="cached-001")
+        assert get_graft_chain("cached-001") == ["cached-001", "cached-001-next"]
+        assert get_graft_chain_root("cached-001-next") == "cached-001"
+
+    def test_graft_chain_sees_rows_written_by_another_process(self, shard_env: Path):
+        """WHY: A long-lived server must see grafts the CLI records in its own process."""
+        import sqlite3
+        from datetime import datetime
+
+        now = datetime.now()
+        worktrees_dir = get_worktrees_dir()
+        worktrees_dir.mkdir(exist_ok=True)
+        (worktrees_dir / "outside-001").mkdir()
+        (worktrees_dir / "outside-001-next").mkdir()
+
+        _record_shard_metadata("outside-001", "abc123", now)
+        assert get_graft_chain("outside-001") == ["outside-001"]
+        # Unknown worktree: falls back to name parsing, and the miss is not kept
+        assert get_graft_chain_root("outside-001-next") == "outside-001-next"
+
+        # Another process records the graft through its own connection
+        conn = sqlite3.connect(str(shard_env / ".skein" / "shards.db"))
+        with conn:
+            conn.execute(
+                "INSERT INTO shards (worktree_name, parent_worktree, base_commit, created_at, "
+                "depth, root_worktree) VALUES (?, ?, 'abc123', ?, 1, ?)",
+                ("outside-001-next", "outside-001", now.isoformat(), "outside-001"),
+            )
+        conn.close()
+
+        assert get_graft_chain_root("outside-001-next") == "outside-001"
+        assert get_graft_chain("outside-001") == ["outside-001", "outside-001-next"]
+
+    def test_chain_root_sees_parent_recorded_by_another_process(self, shard_env: Path):
+        """WHY: A worktree looked up as a root must not stay one after another process adopts it."""
+        import sqlite3
+        from datetime import datetime
+
+        _record_shard_metadata("orphan-wt", "abc123", datetime.now())
+        assert get_graft_chain_root("orphan-wt") == "orphan-wt"
+
+        conn = sqlite3.connect(str(shard_env / ".skein" / "shards.db"))
+        with conn:
+            conn.execute(
+                "UPDATE shards SET parent_worktree = 'parent-wt', root_worktree = 'parent-wt', "
+                "depth = 1 WHERE worktree_name = 'orphan-wt'"
+            )
+        conn.close()
+
+        assert get_graft_chain_root("orphan-wt") == "parent-wt"
+
     def test_is_graft_detection(self, shard_env: Path):
         """WHY: Need to distinguish originals from grafts."""
         assert not is_graft("my-shard-001")
@@ -0,0 +1,137 @@
+"""Tests for JSONStore folio storage and its locator index."""
+
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from skein.models import Folio, Site
+from skein.storage import JSONStore
+
+
+def _folio(folio_id: str, site_id: str = "alpha") -> Folio:
+    return Folio(
+        folio_id=folio_id,
+        type="issue",
+        site_id=site_id,
+        created_at=datetime(2026, 1, 1),
+        created_by="test-agent",
+        title=f"Folio {folio_id}",
+        content="Body",
+    )
+
+
+def _set_mtime(path: Path, seconds_ago: float) -> None:
+    """Backdate a directory so the index trusts (or re-lists) it without sleeping."""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def _make_store(data_dir: Path) -> JSONStore:
+    data_dir.mkdir(exist_ok=True)
+    store = JSONStore(data_dir)
+    for site_id in ("alpha", "beta"):
+        store.save_site(Site(
+            site_id=site_id, created_at=datetime(2026, 1, 1),
+            created_by="test-agent", purpose="testing",
+        ))
+    return store
+
+
+@pytest.fixture
+def store(tmp_path):
+    """JSONStore with two empty sites, alpha and beta."""
+    return _make_store(tmp_path / "data")
+
+
+def _folio_ids(folios):
+    return sorted(f.folio_id for f in folios)
+
+
+class TestFolioIndex:
+    """Test that the folio index tracks the files on disk."""
+
+    def test_save_and_lookup(self, store):
+        """Saved folios are found by site listing and by ID."""
+        store.save_folio(_folio("issue-1"))
+        store.save_folio(_folio("issue-2", site_id="beta"))
+
+        assert _folio_ids(store.get_folios()) == ["issue-1", "issue-2"]
+        assert _folio_ids(store.get_folios(site_id="beta")) == ["issue-2"]
+        assert store.get_folio("issue-2").site_id == "beta"
+
+    def test_move_folio(self, store):
+        """A moved folio is listed under its new site only."""
+        store.save_folio(_folio("issue-1"))
+        store.move_folio("issue-1", "beta")
+
+        assert store.get_folios(site_id="alpha") == []
+        assert _folio_ids(store.get_folios(site_id="beta")) == ["issue-1"]
+        assert store.get_folio("issue-1").site_id == "beta"
+
+    def test_external_add_and_remove(self, store):
+        """Files added or removed outside save_folio show up on the next listing."""
+        folios_dir = store.sites_dir / "alpha" / "folios"
+        store.save_folio(_folio("issue-1"))
+        _set_mtime(folios_dir, 60)
+        assert _folio_ids(store.get_folios(site_id="alpha")) == ["issue-1"]
+
+        (folios_dir / "issue-2.json").write_text(_folio("issue-2").model_dump_json())
+        _set_mtime(folios_dir, 30)
+        assert _folio_ids(store.get_folios(site_id="alpha")) == ["issue-1", "issue-2"]
+
+        (folios_dir / "issue-1.json").unlink()
+        _set_mtime(folios_dir, 10)
+        assert _folio_ids(store.get_folios(site_id="alpha")) == ["issue-2"]
+
+    def test_missing_file_with_unchanged_mtime(self, store):
+        """A listed file that is gone triggers a re-list instead of an error."""
+        folios_dir = store.sites_dir / "alpha" / "folios"
+        store.save_folio(_folio("issue-1"))
+        store.save_folio(_folio("issue-2"))
+        _set_mtime(folios_dir, 60)
+        assert len(store.get_folios(site_id="alpha")) == 2
+
+        # Remove a file but keep the mtime the index recorded
+        recorded = folios_dir.stat().st_mtime_ns
+        (folios_dir / "issue-1.json").unlink()
+        os.utime(folios_dir, ns=(recorded, recorded))
+
+        assert _folio_ids(store.get_folios(site_id="alpha")) == ["issue-2"]
+
+    def test_relocated_data_dir(self, tmp_path, store):
+        """Moving the data directory keeps the index usable."""
+        store.save_folio(_folio("issue-1"))
+        store.save_folio(_folio("issue-2", site_id="beta"))
+        for site_id in ("alpha", "beta"):
+            _set_mtime(store.sites_dir / site_id / "folios", 60)
+        assert len(store.get_folios()) == 2
+
+        moved = tmp_path / "moved"
+        os.rename(store.base_dir, moved)
+        relocated = JSONStore(moved)
+
+        assert _folio_ids(relocated.get_folios()) == ["issue-1", "issue-2"]
+        assert relocated.get_folio("issue-1").site_id == "alpha"
+
+    def test_rebuilds_index_with_stored_paths(self, tmp_path):
+        """An index from before paths were derived is rebuilt from the files."""
+        data_dir = tmp_path / "legacy"
+        data_dir.mkdir()
+        conn = sqlite3.connect(str(data_dir / "folio_index.db"))
+        conn.executescript("""
+            CREATE TABLE folios (folio_id TEXT PRIMARY KEY, site_id TEXT NOT NULL,
+                                 path TEXT NOT NULL, updated_at REAL);
+            CREATE TABLE indexed_sites (site_id TEXT PRIMARY KEY, dir_mtime_ns INTEGER NOT NULL);
+            INSERT INTO folios VALUES ('issue-1', 'alpha', '/nonexistent/issue-1.json', 0);
+        """)
+        conn.close()
+
+        store = _make_store(data_dir)
+        store.save_folio(_folio("issue-1"))
+
+        assert _folio_ids(store.get_folios()) == ["issue-1"]
+        assert store.get_folio("issue-1").site_id == "alpha"
@@ -0,0 +1,68 @@
+"""Tests for SKEIN utility functions."""
+
+import json
+
+import pytest
+
+from skein.utils import _ensure_unique, generate_agent_name
+
+
+# Stdin-protocol generator that also happens to define a generate() helper
+STDIN_GENERATOR = """#!/usr/bin/env python3
+import json
+import sys
+
+def generate(context):
+    return "plugin-" + context["role"]
+
+context = json.loads(sys.stdin.read())
+print("stdin-" + context["role"])
+"""
+
+PLUGIN_GENERATOR = """
+def generate(context):
+    return "plugin-" + context["role"]
+"""
+
+
+@pytest.fixture
+def namer(tmp_path):
+    """Return a factory writing an executable .py generator and its config."""
+    def make_config(source, **naming):
+        script = tmp_path / "namer.py"
+        script.write_text(source)
+        script.chmod(0o755)
+        config = tmp_path / "config.json"
+        config.write_text(json.dumps({"naming": {"generator": str(script), **naming}}))
+        return config
+
+    return make_config
+
+
+class TestCustomGenerator:
+    """Test custom name generator loading."""
+
+    def test_py_generator_runs_as_subprocess_by_default(self, namer):
+        """A generate() helper alone does not get a stdin script imported."""
+        assert generate_agent_name(config_path=namer(STDIN_GENERATOR), role="dev") == "stdin-dev"
+
+    def test_in_process_opt_in(self, namer):
+        """With in_process set, generate(context) is called directly."""
+        assert generate_agent_name(config_path=namer(PLUGIN_GENERATOR, in_process=True), role="dev") == "plugin-dev"
+
+
+class TestEnsureUnique:
+    """Test collision suffixing."""
+
+    def test_next_suffix_resumes_within_growing_set(self):
+        """A shared next_suffix skips suffixes already handed out."""
+        taken = {"fixed", "fixed-2"}
+        next_suffix = {}
+        for expected in ("fixed-1", "fixed-3", "fixed-4"):
+            name = _ensure_unique("fixed", taken, next_suffix)
+            assert name == expected
+            taken.add(name)
+
+    def test_without_next_suffix_scans_from_one(self):
+        """Independent calls start from -1 again."""
+        assert _ensure_unique("fixed", {"fixed"}) == "fixed-1"